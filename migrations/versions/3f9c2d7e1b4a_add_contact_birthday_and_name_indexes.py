@@ -0,0 +1,67 @@
+"""add contact birthday and name indexes
+
+Revision ID: 3f9c2d7e1b4a
+Revises: a621a09113d2
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2d7e1b4a"
+down_revision: Union[str, Sequence[str], None] = "a621a09113d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "contacts",
+        sa.Column(
+            "birthday_mmdd",
+            sa.SmallInteger(),
+            sa.Computed(
+                "CAST(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday)"
+                " AS SMALLINT)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_contacts_user_id_birthday_mmdd",
+        "contacts",
+        ["user_id", "birthday_mmdd"],
+        unique=False,
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_contacts_first_name_trgm",
+        "contacts",
+        ["first_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"first_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_contacts_last_name_trgm",
+        "contacts",
+        ["last_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"last_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_contacts_last_name_trgm", table_name="contacts")
+    op.drop_index("ix_contacts_first_name_trgm", table_name="contacts")
+    op.drop_index("ix_contacts_user_id_birthday_mmdd", table_name="contacts")
+    op.drop_column("contacts", "birthday_mmdd")
@@ -0,0 +1,34 @@
+"""add contact list index
+
+Revision ID: 8b1e4c6d2a90
+Revises: 3f9c2d7e1b4a
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1e4c6d2a90"
+down_revision: Union[str, Sequence[str], None] = "3f9c2d7e1b4a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_contacts_user_id_last_name_first_name",
+        "contacts",
+        ["user_id", "last_name", "first_name", "id"],
+        unique=False,
+        postgresql_include=["email", "phone"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_contacts_user_id_last_name_first_name", table_name="contacts")
@@ -0,0 +1,33 @@
+"""add timestamp server defaults
+
+Revision ID: c47d9e2f5b13
+Revises: 8b1e4c6d2a90
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c47d9e2f5b13"
+down_revision: Union[str, Sequence[str], None] = "8b1e4c6d2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column("contacts", "created_at", server_default=sa.func.now())
+    op.alter_column("contacts", "updated_at", server_default=sa.func.now())
+    op.alter_column("users", "created_at", server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("users", "created_at", server_default=None)
+    op.alter_column("contacts", "updated_at", server_default=None)
+    op.alter_column("contacts", "created_at", server_default=None)
@@ -19,7 +19,6 @@ from fastapi.security import OAuth2PasswordRequestForm
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.services.email import send_verification_email, send_reset_password_email
 from src.schemas import (
     UserCreate,
     Token,
@@ -30,7 +29,7 @@ from src.schemas import (
 )
 from src.services.auth import (
     create_access_token,
-    Hash,
+    hasher,
     create_refresh_token,
     create_email_token,
     verify_refresh_token,
@@ -71,6 +70,9 @@ async def signup(
     :return: The newly created user.
     :rtype: UserModel
     """
+    # fastapi-mail is heavy to import and only needed here, so load it lazily
+    from src.services.email import send_verification_email
+
     user_service = UserService(db, redis)
 
     existing_user = await user_service.get_user_by_email(user_data.email)
@@ -80,11 +82,17 @@ async def signup(
             detail="User with this email already exists",
         )
 
-    user_data.password = Hash().get_password_hash(user_data.password)
-    new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-        send_verification_email, new_user.email, new_user.email, str(request.base_url)
+    user_data = user_data.model_copy(
+        update={"password": await hasher.aget_password_hash(user_data.password)}
     )
+    new_user = await user_service.create_user(user_data)
+    if await user_service.claim_email_send("verification", new_user.email):
+        background_tasks.add_task(
+            send_verification_email,
+            new_user.email,
+            new_user.email,
+            str(request.base_url),
+        )
     return new_user
 
 
@@ -110,7 +118,9 @@ async def signin(
     :rtype: Token
     """
     user = await UserService(db, redis).get_user_by_email(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.password_hash):
+    if not user or not await hasher.averify_password(
+        form_data.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -123,10 +133,8 @@ async def signin(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token, refresh_token = await asyncio.gather(
-        create_access_token(data={"sub": user.email}),
-        create_refresh_token(data={"sub": user.email}),
-    )
+    access_token = create_access_token(data={"sub": user.email})
+    refresh_token = create_refresh_token(data={"sub": user.email})
     user.refresh_token = refresh_token
     await db.commit()
     return {
@@ -164,7 +172,7 @@ async def generate_access_token(
             detail="Unauthorized",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    new_access_token = await create_access_token(data={"sub": user.email})
+    new_access_token = create_access_token(data={"sub": user.email})
     return {
         "access_token": new_access_token,
         "refresh_token": body.refresh_token,
@@ -198,10 +206,13 @@ async def request_confirmation_email(
     :return: Success message.
     :rtype: dict
     """
-    user = await UserService(db, redis).get_user_by_email(body.email)
+    from src.services.email import send_verification_email
+
+    user_service = UserService(db, redis)
+    user = await user_service.get_user_by_email(body.email)
     if user and user.email_verified:
         return {"message": "Email is already verified."}
-    if user:
+    if user and await user_service.claim_email_send("verification", user.email):
         background_tasks.add_task(
             send_verification_email, user.email, user.email, str(request.base_url)
         )
@@ -267,13 +278,20 @@ async def request_rest_password(
     :return: Success message.
     :rtype: dict
     """
+    from src.services.email import send_reset_password_email
+
     user_service = UserService(db, redis)
-    user = await user_service.get_user_by_email(body.email)
-    if user and user.reset_password_token is None:
-        user = await user_service.update_reset_password_token(
-            user, create_email_token({"sub": user.email})
-        )
-    if user and user.email_verified and user.reset_password_token:
+    user = await user_service.set_reset_password_token_if_absent(
+        body.email, create_email_token({"sub": body.email})
+    )
+    if user is None:
+        user = await user_service.get_user_by_email(body.email)
+    if (
+        user
+        and user.email_verified
+        and user.reset_password_token
+        and await user_service.claim_email_send("reset", user.email)
+    ):
         background_tasks.add_task(
             send_reset_password_email,
             user.email,
@@ -316,13 +334,21 @@ async def reset_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid token",
         )
-    if Hash().verify_password(new_password, user.password_hash):
+    # Both bcrypt calls run in the executor, so hash the new password while
+    # checking it against the old one instead of paying for them in sequence.
+    is_same_password, new_hashed_password = await asyncio.gather(
+        hasher.averify_password(new_password, user.password_hash),
+        hasher.aget_password_hash(new_password),
+    )
+    if is_same_password:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="New password must be different from the old password.",
         )
-    new_hashed_password = Hash().get_password_hash(new_password)
-    user = await user_service.update_multiple_user_fields(
-        user, password_hash=new_hashed_password, reset_password_token=None
-    )
+    user = await user_service.reset_password(email, token, new_hashed_password)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid token",
+        )
     return {"message": "Password has been reset successfully."}
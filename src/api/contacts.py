@@ -5,16 +5,19 @@ This module provides CRUD operations for managing user contacts, including
 filtering, searching, and finding contacts with upcoming birthdays.
 """
 
+import base64
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 
 from src.database.db import get_db
-from src.database.models import User
+from src.database.models import Contact, User
 from src.schemas import (
+    ContactFilter,
     ContactResponse,
     ContactModel,
     ContactShortResponse,
@@ -25,12 +28,82 @@ from src.services.auth import get_current_user
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+UNIQUE_CONSTRAINT_ERRORS = {
+    "uq_contact_email_user": "Contact with this email already exists",
+    "uq_contact_phone_user": "Contact with this phone number already exists",
+}
+"""Conflict messages keyed by the unique constraint that was violated."""
+
+
+def unique_violation_detail(error: IntegrityError) -> str | None:
+    """
+    Map an IntegrityError to the conflict message of its unique constraint.
+
+    Uses the constraint name reported by asyncpg when available and falls back
+    to searching the error text once.
+
+    :param error: Error raised while flushing a contact.
+    :type error: IntegrityError
+    :return: Conflict message, or None if no known constraint was violated.
+    :rtype: str | None
+    """
+    constraint = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint is not None:
+        return UNIQUE_CONSTRAINT_ERRORS.get(constraint)
+    message = str(error.orig)
+    for name, detail in UNIQUE_CONSTRAINT_ERRORS.items():
+        if name in message:
+            return detail
+    return None
+
+
+def encode_cursor(contact: Contact) -> str:
+    """
+    Encode a contact's sort key as an opaque pagination cursor.
+
+    :param contact: Last contact of the current page.
+    :type contact: Contact
+    :return: URL-safe cursor string.
+    :rtype: str
+    """
+    key = [contact.last_name, contact.first_name, contact.id]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str, int]:
+    """
+    Decode a pagination cursor back into a contact sort key.
+
+    :param cursor: Cursor produced by encode_cursor.
+    :type cursor: str
+    :raises HTTPException: 400 if the cursor is malformed.
+    :return: Last name, first name and ID of the last contact returned.
+    :rtype: tuple[str, str, int]
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except ValueError:
+        key = None
+    if not (
+        isinstance(key, list)
+        and len(key) == 3
+        and isinstance(key[0], str)
+        and isinstance(key[1], str)
+        and isinstance(key[2], int)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return key[0], key[1], key[2]
+
 
 @router.get("", response_model=List[ContactShortResponse])
 async def get_contacts(
+    response: Response,
     user: User = Depends(get_current_user),
     page: int = Query(1, ge=1),
-    show: int = Query(10, ge=1),
+    show: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
     first_name: str | None = None,
     last_name: str | None = None,
     email: str | None = None,
@@ -40,13 +113,20 @@ async def get_contacts(
     Retrieve a list of contacts for the current user.
 
     Supports pagination and filtering by first name, last name, or email.
+    Contacts are ordered by last name, first name and ID. When a page is full,
+    the ``X-Next-Cursor`` header holds a cursor for the following page; passing
+    it back as ``cursor`` seeks past the previous page instead of using ``page``.
 
+    :param response: Response used to set the ``X-Next-Cursor`` header.
+    :type response: Response
     :param user: The authenticated user.
     :type user: User
     :param page: Page number for pagination (starting from 1).
     :type page: int
-    :param show: Number of contacts per page.
+    :param show: Number of contacts per page (at most 100).
     :type show: int
+    :param cursor: Cursor from a previous ``X-Next-Cursor`` header (optional).
+    :type cursor: str | None
     :param first_name: Filter by first name (optional).
     :type first_name: str | None
     :param last_name: Filter by last name (optional).
@@ -55,20 +135,21 @@ async def get_contacts(
     :type email: str | None
     :param db: Database session dependency.
     :type db: AsyncSession
+    :raises HTTPException: 400 if the cursor is malformed.
     :return: List of contacts matching the criteria.
     :rtype: List[ContactShortResponse]
     """
+    after = decode_cursor(cursor) if cursor is not None else None
     contact_service = ContactService(db)
     contacts = await contact_service.get_contacts(
         user,
         page,
         show,
-        filter={
-            "first_name": first_name,
-            "last_name": last_name,
-            "email": email,
-        },
+        filter=ContactFilter(first_name, last_name, email),
+        after=after,
     )
+    if len(contacts) == show:
+        response.headers["X-Next-Cursor"] = encode_cursor(contacts[-1])
     return contacts
 
 
@@ -124,16 +205,9 @@ async def create_contact(
     try:
         return await contact_service.create_contact(user, contact)
     except IntegrityError as e:
-        if "uq_contact_email_user" in str(e.orig):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Contact with this email already exists",
-            )
-        elif "uq_contact_phone_user" in str(e.orig):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Contact with this phone number already exists",
-            )
+        detail = unique_violation_detail(e)
+        if detail is not None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Could not create contact"
         )
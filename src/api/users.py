@@ -5,6 +5,8 @@ This module provides endpoints for user profile management, including
 retrieving current user information and updating user avatars.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, Request, File, UploadFile
 from fastapi.exceptions import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,7 +25,39 @@ from src.conf.config import settings
 
 router = APIRouter(prefix="/users", tags=["contacts"])
 
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI
+    or f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/0",
+    in_memory_fallback_enabled=True,
+    storage_options={
+        "socket_timeout": settings.RATE_LIMIT_STORAGE_TIMEOUT_SECONDS,
+        "socket_connect_timeout": settings.RATE_LIMIT_STORAGE_TIMEOUT_SECONDS,
+    },
+)
+"""Rate limiter shared by all workers through Redis.
+
+slowapi calls its storage synchronously, so each limited request makes a
+blocking Redis round trip on the event loop. Short socket timeouts bound that
+stall when Redis is slow or down, after which the in-memory fallback is used.
+"""
+
+cloudinary_service = CloudinaryService(
+    settings.CLOUDINARY_CLOUD_NAME,
+    settings.CLOUDINARY_API_KEY,
+    settings.CLOUDINARY_API_SECRET,
+)
+"""Cloudinary service configured once at import."""
+
+
+def get_cloudinary_service() -> CloudinaryService:
+    """
+    Dependency function to get the Cloudinary service.
+
+    :return: Shared Cloudinary service instance.
+    :rtype: CloudinaryService
+    """
+    return cloudinary_service
 
 
 @router.get("/me", response_model=UserModel)
@@ -53,11 +87,13 @@ async def update_user_avatar(
     db: AsyncSession = Depends(get_db),
     redis: Redis = Depends(get_redis),
     user: User = Depends(get_current_admin_user),
+    cloudinary: CloudinaryService = Depends(get_cloudinary_service),
 ):
     """
     Update user avatar image.
 
-    Uploads the avatar to Cloudinary and updates the user's profile.
+    Uploads the avatar to Cloudinary in the default executor, so the blocking
+    HTTP upload does not stall the event loop, and updates the user's profile.
     Requires admin role.
 
     :param file: The avatar image file to upload.
@@ -68,16 +104,17 @@ async def update_user_avatar(
     :type redis: Redis
     :param user: The authenticated admin user.
     :type user: User
+    :param cloudinary: Cloudinary service dependency.
+    :type cloudinary: CloudinaryService
     :raises HTTPException: 500 if avatar upload fails.
     :return: Updated user with new avatar URL.
     :rtype: UserModel
     """
     try:
-        avatar_url = CloudinaryService(
-            settings.CLOUDINARY_CLOUD_NAME,
-            settings.CLOUDINARY_API_KEY,
-            settings.CLOUDINARY_API_SECRET,
-        ).upload_file(file, user.id)
+        loop = asyncio.get_running_loop()
+        avatar_url = await loop.run_in_executor(
+            None, cloudinary.upload_file, file, user.id
+        )
         user = await UserService(db, redis).update_avatar(user, avatar_url)
         return user
     except Exception as e:
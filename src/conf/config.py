@@ -1,9 +1,14 @@
+from functools import lru_cache
+
 from pydantic import EmailStr, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     JWT_SECRET: str
     JWT_ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_SECONDS: int
@@ -28,7 +33,17 @@ class Settings(BaseSettings):
 
     REDIS_HOST: str
     REDIS_PORT: int = 6379
+    REDIS_POOL_SIZE: int = 100
+    REDIS_POOL_TIMEOUT_SECONDS: float = 1.0
     REDIS_CACHE_EXPIRE_SECONDS: int = 3600
+    LOCAL_USER_CACHE_EXPIRE_SECONDS: float = 5
+    LOCAL_USER_CACHE_SIZE: int = 10000
+    EMAIL_RESEND_COOLDOWN_SECONDS: int = 60
+    EMAIL_SEND_ATTEMPTS: int = 3
+    # Storage for slowapi counters; defaults to the Redis instance above
+    RATE_LIMIT_STORAGE_URI: str | None = None
+    # slowapi talks to its storage synchronously, so keep Redis stalls short
+    RATE_LIMIT_STORAGE_TIMEOUT_SECONDS: float = 0.1
 
     # Must be setted in .env to use in compose.yml for redis maxmemory setting, here just for validation
     REDIS_MAX_MEMORY: str
@@ -44,4 +59,18 @@ class Settings(BaseSettings):
         return v
 
 
-settings = Settings()  # type: ignore[arg-type]
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build application settings once and reuse them.
+
+    Parses the environment and .env file on the first call only. Tests can
+    call ``get_settings.cache_clear()`` to force a re-read.
+
+    :return: Application settings.
+    :rtype: Settings
+    """
+    return Settings()  # type: ignore[arg-type]
+
+
+settings = get_settings()
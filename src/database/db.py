@@ -5,13 +5,50 @@ This module provides database session management using SQLAlchemy async engine
 and session makers with proper context management and error handling.
 """
 
-import contextlib
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from src.conf.config import settings
 
 
+class SessionContext:
+    """
+    Async context manager around a single database session.
+
+    Opens a session on enter, rolls it back if a SQLAlchemy error escapes
+    the block and always closes it on exit. Implemented directly rather than
+    with ``contextlib.asynccontextmanager`` since it runs on every request.
+
+    :param session_maker: Session factory used to open the session.
+    :type session_maker: async_sessionmaker
+    """
+
+    __slots__ = ("_session_maker", "_session")
+
+    def __init__(self, session_maker: async_sessionmaker):
+        self._session_maker = session_maker
+        self._session: AsyncSession | None = None
+
+    async def __aenter__(self) -> AsyncSession:
+        self._session = self._session_maker()
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        session = self._session
+        if session is None:
+            return
+        try:
+            if exc_type is not None and issubclass(exc_type, SQLAlchemyError):
+                await session.rollback()
+        finally:
+            await session.close()
+
+
 class DatabaseSessionManager:
     """
     Database session manager for handling async SQLAlchemy sessions.
@@ -28,19 +65,34 @@ class DatabaseSessionManager:
         Initialize the database session manager.
 
         Creates an async engine and session maker for the database connection.
+        The engine keeps a sized connection pool with pre-ping and recycling,
+        and enlarges both the SQLAlchemy compiled-statement cache and the
+        asyncpg prepared-statement caches so hot queries are not re-prepared.
 
         :param url: Database connection URL.
         :type url: str
         """
-        self._engine: AsyncEngine = create_async_engine(url)
+        self._engine: AsyncEngine = create_async_engine(
+            url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            query_cache_size=1200,
+            connect_args={
+                "statement_cache_size": 1024,
+                "prepared_statement_cache_size": 1024,
+                "server_settings": {"jit": "off"},
+            },
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
             bind=self._engine,
             autoflush=False,
             autocommit=False,
+            expire_on_commit=False,
         )
 
-    @contextlib.asynccontextmanager
-    async def session(self):
+    def session(self) -> SessionContext:
         """
         Create and manage a database session context.
 
@@ -48,18 +100,12 @@ class DatabaseSessionManager:
         automatic rollback on errors and proper cleanup.
 
         :raises Exception: If session maker is not initialized.
-        :yields: AsyncSession: Database session.
+        :return: Context manager yielding an AsyncSession.
+        :rtype: SessionContext
         """
         if self._session_maker is None:
             raise Exception("Database session maker is not initialized")
-        session = self._session_maker()
-        try:
-            yield session
-        except SQLAlchemyError:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        return SessionContext(self._session_maker)
 
 
 sessionmanager = DatabaseSessionManager(settings.DB_URL)
@@ -8,9 +8,17 @@ User and Contact entities with their relationships and constraints.
 from enum import Enum
 from datetime import date, datetime
 
-from sqlalchemy import func
-from sqlalchemy.schema import ForeignKey, UniqueConstraint
-from sqlalchemy.types import Integer, String, Date, Text, DateTime, Enum as SqlEnum
+from sqlalchemy import DDL, Computed, event, func
+from sqlalchemy.schema import ForeignKey, Index, UniqueConstraint
+from sqlalchemy.types import (
+    Integer,
+    SmallInteger,
+    String,
+    Date,
+    Text,
+    DateTime,
+    Enum as SqlEnum,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -60,6 +68,9 @@ class Contact(Base):
     :type birthday: date | None
     :param additional_info: Additional notes about the contact (optional).
     :type additional_info: str | None
+    :param birthday_mmdd: Birthday as month * 100 + day, generated by the
+        database and indexed for upcoming-birthday lookups.
+    :type birthday_mmdd: int | None
     :param created_at: Timestamp when the contact was created.
     :type created_at: datetime
     :param updated_at: Timestamp when the contact was last updated.
@@ -74,6 +85,27 @@ class Contact(Base):
     __table_args__ = (
         UniqueConstraint("email", "user_id", name="uq_contact_email_user"),
         UniqueConstraint("phone", "user_id", name="uq_contact_phone_user"),
+        Index("ix_contacts_user_id_birthday_mmdd", "user_id", "birthday_mmdd"),
+        Index(
+            "ix_contacts_user_id_last_name_first_name",
+            "user_id",
+            "last_name",
+            "first_name",
+            "id",
+            postgresql_include=["email", "phone"],
+        ),
+        Index(
+            "ix_contacts_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -83,11 +115,20 @@ class Contact(Base):
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
     birthday: Mapped[date | None] = mapped_column(Date, nullable=True)
     additional_info: Mapped[str | None] = mapped_column(Text, nullable=True)
+    birthday_mmdd: Mapped[int | None] = mapped_column(
+        SmallInteger,
+        Computed(
+            "CAST(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday)"
+            " AS SMALLINT)",
+            persisted=True,
+        ),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=func.now()
+        DateTime, nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
     )
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE", name="fk_contacts_user_id_users"),
@@ -97,6 +138,12 @@ class Contact(Base):
     user = relationship("User", backref="contacts")
 
 
+# Trigram indexes on contact names need pg_trgm; migrations create it too.
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
 class User(Base):
     """
     User model representing an authenticated user.
@@ -130,7 +177,7 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=func.now()
+        DateTime, nullable=False, server_default=func.now()
     )
     avatar_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     refresh_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
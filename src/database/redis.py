@@ -28,17 +28,23 @@ class RedisClient:
         Get or create Redis client instance.
 
         Returns the existing Redis client or creates a new one if it doesn't exist.
-        Uses connection pooling for efficient resource management.
+        The client uses a blocking connection pool sized from settings, so bursts
+        of requests wait briefly for a free connection instead of failing.
 
         :return: Redis client instance.
         :rtype: aioredis.Redis
         """
+        # Nothing is awaited between the check and the assignment, so concurrent
+        # callers cannot create two pools.
         if cls._instance is None:
-            cls._instance = await aioredis.from_url(
+            pool = aioredis.BlockingConnectionPool.from_url(
                 f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/0",
+                max_connections=settings.REDIS_POOL_SIZE,
+                timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
                 encoding="utf-8",
                 decode_responses=True,
             )
+            cls._instance = aioredis.Redis.from_pool(pool)
         return cls._instance
 
     @classmethod
@@ -46,7 +52,7 @@ class RedisClient:
         """
         Close Redis connection.
 
-        Properly closes the Redis connection and resets the singleton instance.
+        Properly closes the Redis connection pool and resets the singleton instance.
         Should be called during application shutdown.
 
         :return: None
@@ -1,11 +1,18 @@
 from typing import List
 from datetime import date
 
-from sqlalchemy import Integer, and_, cast, func, select
+from sqlalchemy import and_, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.database.models import Contact, User
-from src.schemas import ContactModel, ContactUpdate
+from src.schemas import ContactFilter, ContactModel, ContactUpdate
+
+# The list only needs the ContactShortResponse columns, all of which are in
+# ix_contacts_user_id_last_name_first_name, so Postgres can scan the index alone.
+_contact_list_columns = load_only(
+    Contact.id, Contact.first_name, Contact.last_name, Contact.email, Contact.phone
+)
 
 
 class ContactRepository:
@@ -13,23 +20,40 @@ class ContactRepository:
         self.db = db_session
 
     async def get_contacts(
-        self, user: User, skip: int, limit: int, filter: dict | None = None
+        self,
+        user: User,
+        skip: int,
+        limit: int,
+        filter: ContactFilter | None = None,
+        after: tuple[str, str, int] | None = None,
     ) -> List[Contact]:
-        stmt = select(Contact).filter_by(user_id=user.id)
+        stmt = (
+            select(Contact).options(_contact_list_columns).filter_by(user_id=user.id)
+        )
+
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Contact.last_name, Contact.first_name, Contact.id)
+                > tuple_(*after)
+            )
 
         if filter:
             conditions = []
-            if filter.get("first_name"):
-                conditions.append(Contact.first_name.ilike(f"%{filter['first_name']}%"))
-            if filter.get("last_name"):
-                conditions.append(Contact.last_name.ilike(f"%{filter['last_name']}%"))
-            if filter.get("email"):
-                conditions.append(Contact.email == filter["email"])
+            if filter.first_name:
+                conditions.append(Contact.first_name.ilike(f"%{filter.first_name}%"))
+            if filter.last_name:
+                conditions.append(Contact.last_name.ilike(f"%{filter.last_name}%"))
+            if filter.email:
+                conditions.append(Contact.email == filter.email)
 
             if conditions:
                 stmt = stmt.where(and_(*conditions))
 
-        stmt = stmt.offset(skip).limit(limit)
+        stmt = (
+            stmt.order_by(Contact.last_name, Contact.first_name, Contact.id)
+            .offset(skip)
+            .limit(limit)
+        )
 
         contacts = await self.db.execute(stmt)
         result = list(contacts.scalars().all())
@@ -71,16 +95,32 @@ class ContactRepository:
     async def get_contacts_with_birthday_in_period(
         self, user: User, start_date: date, end_date: date
     ) -> List[Contact]:
-        """Get contacts who will have a birthday between two dates"""
+        """Get contacts who will have a birthday after start_date up to end_date"""
+
+        if end_date <= start_date:
+            return []
 
         stmt = select(Contact).where(
-            Contact.user_id == user.id,
-            Contact.birthday.isnot(None),
-            cast(func.extract("year", func.age(start_date, Contact.birthday)), Integer)
-            != cast(
-                func.extract("year", func.age(end_date, Contact.birthday)), Integer
-            ),
+            Contact.user_id == user.id, Contact.birthday_mmdd.isnot(None)
         )
 
+        try:
+            year_after_start = start_date.replace(year=start_date.year + 1)
+        except ValueError:
+            # February 29th: the next year has no such day, so a full year
+            # has only passed once March 1st is reached
+            year_after_start = date(start_date.year + 1, 3, 1)
+
+        if end_date < year_after_start:
+            start_mmdd = start_date.month * 100 + start_date.day
+            end_mmdd = end_date.month * 100 + end_date.day
+            after_start = Contact.birthday_mmdd > start_mmdd
+            until_end = Contact.birthday_mmdd <= end_mmdd
+            if start_mmdd < end_mmdd:
+                stmt = stmt.where(after_start, until_end)
+            else:
+                # The period wraps past December 31st
+                stmt = stmt.where(or_(after_start, until_end))
+
         contacts = await self.db.execute(stmt)
         return list(contacts.scalars().all())
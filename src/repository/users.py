@@ -1,9 +1,22 @@
-from sqlalchemy import select, inspect
+from sqlalchemy import bindparam, select, inspect, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.database.models import User
 from src.schemas import UserCreate
 
+# Lookups built once and reused; only the bound parameter changes per call.
+_select_user_by_id = select(User).where(User.id == bindparam("user_id"))
+_select_user_by_email = select(User).where(User.email == bindparam("email"))
+# Authentication only needs the columns exposed through UserModel.
+_select_auth_user_by_email = (
+    select(User)
+    .options(
+        load_only(User.id, User.email, User.avatar_url, User.email_verified, User.role)
+    )
+    .where(User.email == bindparam("email"))
+)
+
 
 class UserRepository:
     UPDATABLE_FIELDS = {
@@ -12,19 +25,21 @@ class UserRepository:
         "email_verified",
         "reset_password_token",
     }
+    VALID_FIELDS = frozenset(col.key for col in inspect(User).mapper.column_attrs)
 
     def __init__(self, session: AsyncSession):
         self.db = session
-        self._valid_fields = {col.key for col in inspect(User).mapper.column_attrs}
 
     async def get_user_by_id(self, user_id: int) -> User | None:
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_select_user_by_id, {"user_id": user_id})
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_select_user_by_email, {"email": email})
+        return user.scalar_one_or_none()
+
+    async def get_auth_user_by_email(self, email: str) -> User | None:
+        user = await self.db.execute(_select_auth_user_by_email, {"email": email})
         return user.scalar_one_or_none()
 
     async def create_user(
@@ -36,32 +51,58 @@ class UserRepository:
             avatar_url=avatar_url,
         )
         self.db.add(new_user)
+        # The INSERT returns id and created_at, so no refresh is needed.
         await self.db.commit()
-        await self.db.refresh(new_user)
         return new_user
 
+    # User has no server-generated update values and sessions keep objects
+    # loaded after commit, so updates below skip the follow-up refresh SELECT.
     async def set_email_verified(self, user: User) -> User:
         user.email_verified = True
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def update_user_avatar(self, user: User, avatar_url: str) -> User:
         user.avatar_url = avatar_url
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def update_user_password(self, user: User, new_hashed_password: str) -> User:
         user.password_hash = new_hashed_password
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def update_reset_password_token(self, user: User, token: str | None) -> User:
         user.reset_password_token = token
         await self.db.commit()
-        await self.db.refresh(user)
+        return user
+
+    async def set_reset_password_token_if_absent(
+        self, email: str, token: str
+    ) -> User | None:
+        stmt = (
+            update(User)
+            .where(User.email == email, User.reset_password_token.is_(None))
+            .values(reset_password_token=token)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        await self.db.commit()
+        return user
+
+    async def reset_password(
+        self, email: str, token: str, new_hashed_password: str
+    ) -> User | None:
+        stmt = (
+            update(User)
+            .where(User.email == email, User.reset_password_token == token)
+            .values(password_hash=new_hashed_password, reset_password_token=None)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        await self.db.commit()
         return user
 
     # Use this method to update multiple fields atomically and with one commit
@@ -82,7 +123,7 @@ class UserRepository:
         """
         if not fields:
             return user  # No fields to update
-        invalid_fields = set(fields.keys()) - self._valid_fields
+        invalid_fields = set(fields.keys()) - self.VALID_FIELDS
         if invalid_fields:
             raise ValueError(
                 f"Fields do not exist in User model: {', '.join(invalid_fields)}"
@@ -99,5 +140,4 @@ class UserRepository:
             setattr(user, key, value)
 
         await self.db.commit()
-        await self.db.refresh(user)
         return user
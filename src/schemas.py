@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict, EmailStr, field_validator
@@ -27,6 +28,7 @@ def validate_birthday(birthday: Optional[date]) -> Optional[date]:
 
 
 class ContactModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
     first_name: str = Field(min_length=2, max_length=50)
     last_name: str = Field(min_length=2, max_length=50)
     email: EmailStr
@@ -46,6 +48,7 @@ class ContactModel(BaseModel):
 
 
 class ContactUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True)
     first_name: Optional[str] = Field(None, min_length=2, max_length=50)
     last_name: Optional[str] = Field(None, min_length=2, max_length=50)
     email: Optional[EmailStr] = None
@@ -64,6 +67,13 @@ class ContactUpdate(BaseModel):
         return validate_phone_number(v) if v is not None else v
 
 
+@dataclass(frozen=True, slots=True)
+class ContactFilter:
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+
+
 class ContactResponse(ContactModel):
     id: int
     model_config = ConfigDict(from_attributes=True)
@@ -88,6 +98,7 @@ class UserModel(BaseModel):
 
 
 class UserCreate(BaseModel):
+    model_config = ConfigDict(frozen=True)
     email: EmailStr
     password: str = Field(min_length=6, max_length=72)
     role: UserRole
@@ -100,12 +111,15 @@ class Token(BaseModel):
 
 
 class TokenRefreshRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
     refresh_token: str
 
 
 class EmailVerificationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
     email: EmailStr
 
 
 class ResetPasswordRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
     email: EmailStr
@@ -6,14 +6,22 @@ JWT token creation and validation, user authentication, and role-based
 access control using OAuth2 bearer tokens.
 """
 
+import asyncio
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, UTC
+from functools import lru_cache
 from typing import Literal
 
 from fastapi import Depends, HTTPException, status
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from redis.asyncio import Redis
 
 from src.database.models import User, UserRole
@@ -33,13 +41,20 @@ class Hash:
     Password hashing utility class.
 
     Provides methods for hashing passwords and verifying password hashes
-    using bcrypt algorithm through passlib.
+    using bcrypt algorithm through passlib. Async variants run bcrypt in the
+    default executor so the event loop is not blocked, and successful
+    verifications are remembered in a small LRU cache.
 
     :cvar pwd_context: Password context for bcrypt hashing.
     :type pwd_context: CryptContext
+    :cvar VERIFY_CACHE_SIZE: Maximum number of cached successful verifications.
+    :type VERIFY_CACHE_SIZE: int
     """
 
     pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    VERIFY_CACHE_SIZE = 1024
+    _verify_cache_key = secrets.token_bytes(32)
+    _verify_cache: OrderedDict[tuple[bytes, str], bool] = OrderedDict()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -65,6 +80,57 @@ class Hash:
         """
         return self.pwd_context.hash(password)
 
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password without blocking the event loop.
+
+        Runs bcrypt in the default executor. Successful results are cached by
+        an HMAC-SHA256 of the password under a random per-process key and the
+        stored hash, so a changed password hash never matches a stale entry,
+        and neither the cleartext nor an unsalted fast hash of it is retained.
+
+        :param plain_password: Plain text password to verify.
+        :type plain_password: str
+        :param hashed_password: Hashed password to compare against.
+        :type hashed_password: str
+        :return: True if password matches, False otherwise.
+        :rtype: bool
+        """
+        cache_key = (
+            hmac.new(
+                self._verify_cache_key, plain_password.encode(), hashlib.sha256
+            ).digest(),
+            hashed_password,
+        )
+        if cache_key in self._verify_cache:
+            self._verify_cache.move_to_end(cache_key)
+            return True
+
+        loop = asyncio.get_running_loop()
+        is_valid = await loop.run_in_executor(
+            None, self.verify_password, plain_password, hashed_password
+        )
+        if is_valid:
+            self._verify_cache[cache_key] = True
+            if len(self._verify_cache) > self.VERIFY_CACHE_SIZE:
+                self._verify_cache.popitem(last=False)
+        return is_valid
+
+    async def aget_password_hash(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+
+        :param password: Plain text password to hash.
+        :type password: str
+        :return: Hashed password string.
+        :rtype: str
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_password_hash, password)
+
+
+hasher = Hash()
+"""Shared password hashing instance."""
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/signin")
 """OAuth2 password bearer scheme for token authentication."""
@@ -95,9 +161,7 @@ def create_jwt_token(
     return encoded_jwt
 
 
-async def create_access_token(
-    data: dict, expires_delta: timedelta | None = None
-) -> str:
+def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create an access token for authentication.
 
@@ -119,9 +183,7 @@ async def create_access_token(
     return access_token
 
 
-async def create_refresh_token(
-    data: dict, expires_delta: timedelta | None = None
-) -> str:
+def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create a refresh token for obtaining new access tokens.
 
@@ -143,6 +205,31 @@ async def create_refresh_token(
     return refresh_token
 
 
+@lru_cache(maxsize=8192)
+def decode_access_token(token: str) -> tuple[str, int | None]:
+    """
+    Decode and validate an access token, caching successful results.
+
+    The signature and token type are checked once per distinct token; repeat
+    requests with the same token reuse the result. Callers must still compare
+    the returned expiry with the current time, since a cached token may have
+    expired since it was first decoded.
+
+    :param token: JWT access token.
+    :type token: str
+    :raises InvalidTokenError: If the token is invalid, expired, or not an access token.
+    :return: Email from the token subject and its expiry timestamp.
+    :rtype: tuple[str, int | None]
+    """
+    payload = jwt.decode(
+        token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+    )
+    email = payload.get("sub")
+    if email is None or payload.get("token_type") != "access":
+        raise InvalidTokenError("Not an access token")
+    return email, payload.get("exp")
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
@@ -170,20 +257,16 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        email = payload.get("sub")
-        token_type = payload.get("token_type")
-        if email is None or token_type != "access":
-            raise credentials_exception
-    except JWTError:
+        email, expires_at = decode_access_token(token)
+    except InvalidTokenError:
+        raise credentials_exception
+    if expires_at is not None and expires_at <= time.time():
         raise credentials_exception
 
     user_service = UserService(db, redis_client)
     user = await user_service.get_cached_user_by_email(email)
     if user is None:
-        user = await user_service.get_user_by_email(email)
+        user = await user_service.get_auth_user_by_email(email)
 
     if user is None:
         raise credentials_exception
@@ -214,7 +297,7 @@ async def verify_refresh_token(
             return None
         user = await UserService(db, redis_client).get_user_by_email(email)
         return user
-    except JWTError:
+    except InvalidTokenError:
         return None
 
 
@@ -260,7 +343,7 @@ def get_email_from_token(token: str) -> str:
         if email is None:
             raise invalid_token_exception
         return email
-    except JWTError:
+    except InvalidTokenError:
         raise invalid_token_exception
 
 
@@ -276,9 +359,6 @@ def get_current_admin_user(user: User = Depends(get_current_user)):
     :return: Admin user object.
     :rtype: User
     """
-    print(f"user.role: {user.role!r} (type: {type(user.role)})")
-    print(f"UserRole.ADMIN: {UserRole.ADMIN!r} (type: {type(UserRole.ADMIN)})")
-    print(f"Are they equal? {user.role == UserRole.ADMIN}")
     if user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
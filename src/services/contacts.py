@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactModel, ContactUpdate
+from src.schemas import ContactFilter, ContactModel, ContactUpdate
 
 
 class ContactService:
@@ -36,12 +36,20 @@ class ContactService:
         self.contact_repository = ContactRepository(db)
 
     async def get_contacts(
-        self, user: User, page: int, show: int, filter: dict | None = None
+        self,
+        user: User,
+        page: int,
+        show: int,
+        filter: ContactFilter | None = None,
+        after: tuple[str, str, int] | None = None,
     ):
         """
         Retrieve paginated list of contacts for a user.
 
-        Supports optional filtering by first name, last name, or email.
+        Contacts are ordered by last name, first name and ID. Supports optional
+        filtering by first name, last name, or email. When ``after`` is given,
+        the page starts right after that sort key and ``page`` is ignored.
+        Only the columns of ``ContactShortResponse`` are loaded.
 
         :param user: User whose contacts to retrieve.
         :type user: User
@@ -49,13 +57,17 @@ class ContactService:
         :type page: int
         :param show: Number of contacts per page.
         :type show: int
-        :param filter: Optional filter dictionary with first_name, last_name, or email keys.
-        :type filter: dict | None
+        :param filter: Optional filter by first name, last name, or email.
+        :type filter: ContactFilter | None
+        :param after: Sort key (last name, first name, ID) of the last contact
+            already returned.
+        :type after: tuple[str, str, int] | None
         :return: List of contacts matching criteria.
         :rtype: List[Contact]
         """
+        skip = 0 if after is not None else show * (page - 1)
         return await self.contact_repository.get_contacts(
-            user, skip=show * (page - 1), limit=show, filter=filter
+            user, skip=skip, limit=show, filter=filter, after=after
         )
 
     async def get_contact(self, user: User, contact_id: int):
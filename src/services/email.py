@@ -5,6 +5,8 @@ This module provides email functionality for user verification and password rese
 using FastMail with HTML templates and SMTP configuration.
 """
 
+import asyncio
+import logging
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
@@ -14,6 +16,8 @@ from pydantic import EmailStr, NameEmail
 from src.services.auth import create_email_token
 from src.conf.config import settings
 
+logger = logging.getLogger(__name__)
+
 conf = ConnectionConfig(
     MAIL_USERNAME=settings.SMTP_USER,
     MAIL_PASSWORD=settings.SMTP_PASSWORD,
@@ -29,6 +33,51 @@ conf = ConnectionConfig(
 )
 """FastMail configuration using SMTP settings from application config."""
 
+fast_mail = FastMail(conf)
+"""Shared FastMail client used for all outgoing emails."""
+
+template_env = conf.template_engine()
+"""Jinja environment that keeps compiled email templates between sends."""
+
+
+def render_template(template_name: str, **context: str) -> str:
+    """
+    Render an email template from the shared Jinja environment.
+
+    :param template_name: Template file name inside the template folder.
+    :type template_name: str
+    :param context: Variables passed to the template.
+    :type context: str
+    :return: Rendered HTML body.
+    :rtype: str
+    """
+    return template_env.get_template(template_name).render(**context)
+
+
+async def deliver_message(message: MessageSchema, email: str) -> None:
+    """
+    Send a message, retrying SMTP connection failures with backoff.
+
+    Waits 1, 2, 4... seconds between attempts, up to EMAIL_SEND_ATTEMPTS in
+    total, and logs the failure if every attempt fails.
+
+    :param message: Message to send.
+    :type message: MessageSchema
+    :param email: Recipient's email address, used for logging.
+    :type email: str
+    :return: None
+    """
+    for attempt in range(1, settings.EMAIL_SEND_ATTEMPTS + 1):
+        try:
+            await fast_mail.send_message(message)
+            return
+        except ConnectionErrors:
+            if attempt == settings.EMAIL_SEND_ATTEMPTS:
+                logger.exception("Failed to send email to %s", email)
+                return
+            logger.warning("Sending email to %s failed, retrying", email)
+            await asyncio.sleep(2 ** (attempt - 1))
+
 
 async def send_verification_email(email: EmailStr, username: str, host: str) -> None:
     """
@@ -44,24 +93,19 @@ async def send_verification_email(email: EmailStr, username: str, host: str) ->
     :param host: Application host URL for building verification link.
     :type host: str
     :return: None
-    :raises ConnectionErrors: If email sending fails (caught and logged).
     """
-    try:
-        message = MessageSchema(
-            subject="Confirm your email",
-            recipients=[NameEmail(email=email, name=username)],
-            template_body={
-                "host": host,
-                "username": username,
-                "token": create_email_token({"sub": email}),
-            },
-            subtype=MessageType.html,
-        )
-
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="email-verification.html")
-    except ConnectionErrors as e:
-        print(f"Failed to send email to {email}: {e}")
+    message = MessageSchema(
+        subject="Confirm your email",
+        recipients=[NameEmail(email=email, name=username)],
+        body=render_template(
+            "email-verification.html",
+            host=host,
+            username=username,
+            token=create_email_token({"sub": email}),
+        ),
+        subtype=MessageType.html,
+    )
+    await deliver_message(message, email)
 
 
 async def send_reset_password_email(
@@ -82,20 +126,16 @@ async def send_reset_password_email(
     :param reset_token: Password reset token for verification.
     :type reset_token: str
     :return: None
-    :raises ConnectionErrors: If email sending fails (caught and logged).
     """
-    try:
-        message = MessageSchema(
-            subject="Reset your password",
-            recipients=[NameEmail(email=email, name=username)],
-            template_body={
-                "host": host,
-                "username": username,
-                "token": reset_token,
-            },
-            subtype=MessageType.html,
-        )
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="reset-password.html")
-    except ConnectionErrors as e:
-        print(f"Failed to send email to {email}: {e}")
+    message = MessageSchema(
+        subject="Reset your password",
+        recipients=[NameEmail(email=email, name=username)],
+        body=render_template(
+            "reset-password.html",
+            host=host,
+            username=username,
+            token=reset_token,
+        ),
+        subtype=MessageType.html,
+    )
+    await deliver_message(message, email)
@@ -6,13 +6,17 @@ user creation, retrieval, email verification, avatar updates, password managemen
 and Redis caching functionality.
 """
 
+import time
+from collections import OrderedDict
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import inspect as sqlalchemy_inspect
+from sqlalchemy.orm.attributes import instance_state
 from redis.asyncio import Redis
 
 from src.repository.users import UserRepository
 from src.schemas import UserCreate, UserModel
-from src.database.models import User
+from src.database.models import User, UserRole
 from src.conf.config import settings
 
 
@@ -24,12 +28,22 @@ class UserService:
     password management, and Redis caching. Acts as an intermediary between
     API endpoints and the user repository.
 
+    Cached users are also kept in a short-lived process-local cache in front
+    of Redis, so back-to-back authenticated requests skip the Redis round-trip.
+
     :param db: Database session for repository operations.
     :type db: AsyncSession
     :param redis_client: Redis client for caching user data.
     :type redis_client: Redis
+    :cvar CACHED_FIELDS: User attributes stored in the cache (UserModel fields).
+    :type CACHED_FIELDS: tuple[str, ...]
+    :cvar _local_cache: Process-local LRU cache of user data by email, with expiry.
+    :type _local_cache: OrderedDict[str, tuple[float, dict]]
     """
 
+    CACHED_FIELDS = tuple(UserModel.model_fields)
+    _local_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
     def __init__(self, db: AsyncSession, redis_client: Redis):
         """
         Initialize user service with database session and Redis client.
@@ -83,25 +97,54 @@ class UserService:
             await self.cache_user(user)
         return user
 
+    async def get_auth_user_by_email(self, email: str) -> User | None:
+        """
+        Retrieve the columns needed for authentication and cache the result.
+
+        Loads only the fields exposed through UserModel, leaving password and
+        token columns unloaded, like users returned from the cache.
+
+        :param email: User's email address.
+        :type email: str
+        :return: User object if found, None otherwise.
+        :rtype: User | None
+        """
+        user = await self.repository.get_auth_user_by_email(email)
+        if user:
+            await self.cache_user(user)
+        return user
+
     async def get_cached_user_by_email(self, email: str) -> User | None:
         """
         Retrieve a user from Redis cache by email address.
 
-        Returns cached user data without querying the database.
-        If user is not in cache, returns None.
+        Returns cached user data without querying the database, checking the
+        process-local cache before Redis. A Redis hit also renews the entry's
+        expiry in the same round-trip, so active users stay cached. If user is
+        not in cache, returns None.
 
         :param email: User's email address.
         :type email: str
         :return: User object from cache if found, None otherwise.
         :rtype: User | None
         """
+        local_entry = self._local_cache.get(email)
+        if local_entry is not None and local_entry[0] > time.monotonic():
+            self._local_cache.move_to_end(email)
+            return User(**local_entry[1])
+
         cache_key = f"user:email:{email}"
-        cached_user = await self.redis_client.get(cache_key)
+        cached_user = await self.redis_client.getex(
+            cache_key, ex=settings.REDIS_CACHE_EXPIRE_SECONDS
+        )
         if not cached_user:
             return None
-        user_data = UserModel.model_validate_json(cached_user)
-        user = User(**user_data.model_dump())
-        return user
+        # Cached data was written by cache_user from a stored row, so it only
+        # needs decoding; re-running email validation would dominate a hit.
+        user_data = orjson.loads(cached_user)
+        user_data["role"] = UserRole(user_data["role"])
+        self._cache_locally(email, user_data)
+        return User(**user_data)
 
     async def confirm_user_email(self, user: User) -> User:
         """
@@ -137,23 +180,23 @@ class UserService:
         """
         Ensure user is managed by the database session.
 
-        If the user object is detached from the session, merges it back
-        and refreshes the object state.
+        If the user object is not attached to the session (for example, a
+        user rebuilt from the cache), loads the stored row by primary key.
+        The row is loaded rather than merged so that possibly stale cached
+        fields are never copied onto it and written back on commit.
 
         :param user: User object to check and manage.
         :type user: User
         :return: Managed user object.
         :rtype: User
         """
-        state = sqlalchemy_inspect(user)
-        if not state.persistent:
-            user = await self.repository.db.merge(user)
-            await self.repository.db.refresh(user)
+        if not instance_state(user).persistent:
+            user = await self.repository.db.get(User, user.id)
         return user
 
     async def update_user_password(self, user: User, new_hashed_password: str) -> User:
         """
-        Update user's password hash and invalidate cache.
+        Update user's password hash and refresh cache.
 
         :param user: User object to update.
         :type user: User
@@ -164,15 +207,14 @@ class UserService:
         """
         user = await self._ensure_user_managed(user)
         user = await self.repository.update_user_password(user, new_hashed_password)
-        await self.invalidate_user_cache(user.email)
+        await self.cache_user(user)
         return user
 
     async def update_reset_password_token(self, user: User, token: str | None) -> User:
         """
         Update user's password reset token and manage cache.
 
-        Sets or clears the reset password token. Invalidates cache when
-        a new token is set.
+        Sets or clears the reset password token and refreshes the cache.
 
         :param user: User object to update.
         :type user: User
@@ -183,8 +225,51 @@ class UserService:
         """
         user = await self._ensure_user_managed(user)
         user = await self.repository.update_reset_password_token(user, token)
-        if token is not None:
-            await self.invalidate_user_cache(user.email)
+        await self.cache_user(user)
+        return user
+
+    async def set_reset_password_token_if_absent(
+        self, email: str, token: str
+    ) -> User | None:
+        """
+        Store a password reset token unless the user already has one.
+
+        Checks and updates the user in a single statement and refreshes
+        the cache when a token was stored.
+
+        :param email: User's email address.
+        :type email: str
+        :param token: Password reset token to store.
+        :type token: str
+        :return: Updated user, or None if no user without a token matched.
+        :rtype: User | None
+        """
+        user = await self.repository.set_reset_password_token_if_absent(email, token)
+        if user is not None:
+            await self.cache_user(user)
+        return user
+
+    async def reset_password(
+        self, email: str, token: str, new_hashed_password: str
+    ) -> User | None:
+        """
+        Replace the password and clear the reset token if the token matches.
+
+        Checks the token and updates the user in a single statement, then
+        refreshes the cache.
+
+        :param email: User's email address.
+        :type email: str
+        :param token: Password reset token that must match the stored one.
+        :type token: str
+        :param new_hashed_password: New hashed password.
+        :type new_hashed_password: str
+        :return: Updated user, or None if the token did not match.
+        :rtype: User | None
+        """
+        user = await self.repository.reset_password(email, token, new_hashed_password)
+        if user is not None:
+            await self.cache_user(user)
         return user
 
     async def update_multiple_user_fields(self, user: User, **fields) -> User:
@@ -206,29 +291,85 @@ class UserService:
         """
         Store user data in Redis cache.
 
-        Serializes user object to JSON and stores it in Redis with
-        an expiration time defined in settings.
+        Serializes the UserModel fields of the user object to JSON and
+        stores them in Redis with an expiration time defined in settings,
+        and refreshes the process-local copy.
 
         :param user: User object to cache.
         :type user: User
         :return: None
         """
         cache_key = f"user:email:{user.email}"
-        user_data = UserModel.model_validate(user).model_dump_json()
+        user_data = {field: getattr(user, field) for field in self.CACHED_FIELDS}
         await self.redis_client.set(
-            cache_key, user_data, ex=settings.REDIS_CACHE_EXPIRE_SECONDS
+            cache_key,
+            orjson.dumps(user_data),
+            ex=settings.REDIS_CACHE_EXPIRE_SECONDS,
+        )
+        self._cache_locally(user.email, user_data)
+
+    async def claim_email_send(self, kind: str, email: str) -> bool:
+        """
+        Reserve the right to send an email of the given kind to an address.
+
+        Uses a Redis key that expires after the resend cooldown, so repeated
+        requests for the same address within the cooldown send only once.
+
+        :param kind: Email kind, e.g. "verification" or "reset".
+        :type kind: str
+        :param email: Recipient's email address.
+        :type email: str
+        :return: True if the email should be sent, False during the cooldown.
+        :rtype: bool
+        """
+        return bool(
+            await self.redis_client.set(
+                f"email:{kind}:{email}",
+                1,
+                nx=True,
+                ex=settings.EMAIL_RESEND_COOLDOWN_SECONDS,
+            )
         )
 
     async def invalidate_user_cache(self, email: str) -> None:
         """
         Remove user data from Redis cache.
 
-        Deletes cached user data by email key, forcing next retrieval
-        to query the database.
+        Deletes cached user data by email key from Redis and the local
+        cache, forcing next retrieval to query the database.
 
         :param email: User's email address.
         :type email: str
         :return: None
         """
         cache_key = f"user:email:{email}"
+        self._local_cache.pop(email, None)
         await self.redis_client.delete(cache_key)
+
+    @classmethod
+    def _cache_locally(cls, email: str, user_data: dict) -> None:
+        """
+        Store user data in the process-local cache.
+
+        Evicts the least recently used entry once the cache is full.
+
+        :param email: User's email address.
+        :type email: str
+        :param user_data: Serialized user fields.
+        :type user_data: dict
+        :return: None
+        """
+        expires_at = time.monotonic() + settings.LOCAL_USER_CACHE_EXPIRE_SECONDS
+        cls._local_cache[email] = (expires_at, user_data)
+        cls._local_cache.move_to_end(email)
+        if len(cls._local_cache) > settings.LOCAL_USER_CACHE_SIZE:
+            cls._local_cache.popitem(last=False)
+
+    @classmethod
+    def clear_local_cache(cls) -> None:
+        """
+        Drop every entry from the process-local user cache.
+
+        :return: None
+        """
+        cls._local_cache.clear()
@@ -0,0 +1,19 @@
+import os
+
+# Keep rate limit counters in process so limiter.reset() between tests never
+# touches a real Redis; must be set before src.api.users creates the limiter
+os.environ["RATE_LIMIT_STORAGE_URI"] = "memory://"
+
+# Redis ships with 16 logical databases and each xdist worker needs its own
+REDIS_DATABASES = 16
+
+
+def pytest_xdist_auto_num_workers(config) -> int:
+    """
+    Cap ``-n auto`` at one worker per Redis database.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return min(cpus, REDIS_DATABASES)
@@ -192,3 +192,22 @@ async def test_request_confirmation_email_for_unverified_user(client, monkeypatc
     assert resp2.status_code == 200
     data = resp2.json()
     assert "Confirmation email has been sent" in data["message"]
+
+
+@pytest.mark.asyncio
+async def test_request_confirmation_email_debounced(client, monkeypatch):
+    """Repeated confirmation requests within the cooldown send one email."""
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.services.email.send_verification_email", mock_send_email)
+
+    resp = await client.post("/api/auth/signup", json=user_data)
+    assert resp.status_code == 201
+
+    for _ in range(3):
+        resp2 = await client.post(
+            "/api/auth/request-confirmation-email",
+            json={"email": user_data["email"]},
+        )
+        assert resp2.status_code == 200
+
+    mock_send_email.assert_called_once()
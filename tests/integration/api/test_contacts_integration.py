@@ -1,3 +1,4 @@
+import orjson
 import pytest
 from datetime import date, timedelta
 
@@ -10,12 +11,25 @@ contact_data = {
     "birthday": "1990-05-15",
     "additional_info": "Test contact",
 }
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def contact_payload(**overrides) -> bytes:
+    """Serialize sample contact data with the given fields overridden."""
+    return orjson.dumps({**contact_data, **overrides})
+
+
+async def post_contact(client, **overrides):
+    """Create a contact from sample data with the given fields overridden."""
+    return await client.post(
+        "/api/contacts", content=contact_payload(**overrides), headers=JSON_HEADERS
+    )
 
 
 @pytest.mark.asyncio
 async def test_create_contact_success(authorized_client):
     """Test creating a new contact."""
-    response = await authorized_client.post("/api/contacts", json=contact_data)
+    response = await post_contact(authorized_client)
     assert response.status_code == 201
     data = response.json()
     assert data["first_name"] == contact_data["first_name"]
@@ -28,7 +42,7 @@ async def test_create_contact_success(authorized_client):
 @pytest.mark.asyncio
 async def test_create_contact_unauthorized(client):
     """Test creating contact without authentication."""
-    response = await client.post("/api/contacts", json=contact_data)
+    response = await post_contact(client)
     assert response.status_code == 401
 
 
@@ -36,11 +50,11 @@ async def test_create_contact_unauthorized(client):
 async def test_create_contact_duplicate_email(authorized_client):
     """Test creating contact with duplicate email for same user."""
     # Create first contact
-    resp1 = await authorized_client.post("/api/contacts", json=contact_data)
+    resp1 = await post_contact(authorized_client)
     assert resp1.status_code == 201
 
     # Try to create second contact with same email
-    resp2 = await authorized_client.post("/api/contacts", json=contact_data)
+    resp2 = await post_contact(authorized_client)
     assert resp2.status_code == 409
     data = resp2.json()
     assert "already exists" in data["message"]
@@ -50,27 +64,36 @@ async def test_create_contact_duplicate_email(authorized_client):
 async def test_create_contact_duplicate_phone(authorized_client):
     """Test creating contact with duplicate phone for same user."""
     # Create first contact
-    resp1 = await authorized_client.post("/api/contacts", json=contact_data)
+    resp1 = await post_contact(authorized_client)
     assert resp1.status_code == 201
 
     # Try to create second contact with same phone but different email
-    duplicate_phone_data = contact_data.copy()
-    duplicate_phone_data["email"] = "different@example.com"
-
-    resp2 = await authorized_client.post("/api/contacts", json=duplicate_phone_data)
+    resp2 = await post_contact(authorized_client, email="different@example.com")
     assert resp2.status_code == 409
     data = resp2.json()
     assert "phone number already exists" in data["message"]
 
 
 @pytest.mark.asyncio
-async def test_create_contact_invalid_phone(authorized_client):
-    """Test creating contact with invalid phone number."""
-    invalid_contact = contact_data.copy()
-    invalid_contact["phone"] = "invalid-phone"
-    invalid_contact["email"] = "unique@example.com"
-
-    response = await authorized_client.post("/api/contacts", json=invalid_contact)
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(
+            contact_payload(phone="invalid-phone", email="unique@example.com"),
+            id="invalid-phone",
+        ),
+        pytest.param(
+            contact_payload(email="not-an-email", phone="+380509999999"),
+            id="invalid-email",
+        ),
+        pytest.param(orjson.dumps({"first_name": "John"}), id="missing-fields"),
+    ],
+)
+async def test_create_contact_invalid_input(authorized_client, payload):
+    """Test creating contact with invalid or incomplete data."""
+    response = await authorized_client.post(
+        "/api/contacts", content=payload, headers=JSON_HEADERS
+    )
     assert response.status_code == 422
 
 
@@ -85,14 +108,20 @@ async def test_get_contacts_empty(authorized_client):
 
 
 @pytest.mark.asyncio
-async def test_get_contacts_list(authorized_client):
+async def test_get_contacts_list(authorized_client, test_user_in_db, seed_contacts):
     """Test getting list of contacts."""
     # Create multiple contacts
-    for i in range(3):
-        contact = contact_data.copy()
-        contact["email"] = f"contact{i}@example.com"
-        contact["phone"] = f"+38050123456{i}"
-        await authorized_client.post("/api/contacts", json=contact)
+    await seed_contacts(
+        test_user_in_db,
+        [
+            {
+                **contact_data,
+                "email": f"contact{i}@example.com",
+                "phone": f"+38050123456{i}",
+            }
+            for i in range(3)
+        ],
+    )
 
     # Get contacts
     response = await authorized_client.get("/api/contacts")
@@ -102,14 +131,22 @@ async def test_get_contacts_list(authorized_client):
 
 
 @pytest.mark.asyncio
-async def test_get_contacts_pagination(authorized_client):
+async def test_get_contacts_pagination(
+    authorized_client, test_user_in_db, seed_contacts
+):
     """Test pagination in get contacts."""
     # Create 15 contacts
-    for i in range(15):
-        contact = contact_data.copy()
-        contact["email"] = f"contact{i}@example.com"
-        contact["phone"] = f"+38050123{i:04d}"
-        await authorized_client.post("/api/contacts", json=contact)
+    await seed_contacts(
+        test_user_in_db,
+        [
+            {
+                **contact_data,
+                "email": f"contact{i}@example.com",
+                "phone": f"+38050123{i:04d}",
+            }
+            for i in range(15)
+        ],
+    )
 
     # Get first page (default show=10)
     resp1 = await authorized_client.get("/api/contacts?page=1&show=10")
@@ -124,22 +161,65 @@ async def test_get_contacts_pagination(authorized_client):
     assert len(data2) == 5
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_cursor_pagination(
+    authorized_client, test_user_in_db, seed_contacts
+):
+    """Test walking contacts with the next-page cursor."""
+    await seed_contacts(
+        test_user_in_db,
+        [
+            {
+                **contact_data,
+                "last_name": f"Name{i}",
+                "email": f"cursor{i}@example.com",
+                "phone": f"+38050124{i:04d}",
+            }
+            for i in range(5)
+        ],
+    )
+
+    resp1 = await authorized_client.get("/api/contacts?show=3")
+    assert resp1.status_code == 200
+    assert [c["last_name"] for c in resp1.json()] == ["Name0", "Name1", "Name2"]
+    cursor = resp1.headers["X-Next-Cursor"]
+
+    resp2 = await authorized_client.get(f"/api/contacts?show=3&cursor={cursor}")
+    assert resp2.status_code == 200
+    assert [c["last_name"] for c in resp2.json()] == ["Name3", "Name4"]
+    assert "X-Next-Cursor" not in resp2.headers
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_invalid_cursor(authorized_client):
+    """Test that a malformed cursor is rejected."""
+    response = await authorized_client.get("/api/contacts?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_page_size_limit(authorized_client):
+    """Test that page size above the limit is rejected."""
+    response = await authorized_client.get("/api/contacts?show=101")
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_get_contacts_filter_by_first_name(authorized_client):
     """Test filtering contacts by first name."""
     # Create contacts with different names
-    contact1 = contact_data.copy()
-    contact1["first_name"] = "Alice"
-    contact1["email"] = "alice@example.com"
-    contact1["phone"] = "+380501111111"
-
-    contact2 = contact_data.copy()
-    contact2["first_name"] = "Bob"
-    contact2["email"] = "bob@example.com"
-    contact2["phone"] = "+380502222222"
-
-    await authorized_client.post("/api/contacts", json=contact1)
-    await authorized_client.post("/api/contacts", json=contact2)
+    await post_contact(
+        authorized_client,
+        first_name="Alice",
+        email="alice@example.com",
+        phone="+380501111111",
+    )
+    await post_contact(
+        authorized_client,
+        first_name="Bob",
+        email="bob@example.com",
+        phone="+380502222222",
+    )
 
     # Filter by first name
     response = await authorized_client.get("/api/contacts?first_name=Alice")
@@ -153,11 +233,9 @@ async def test_get_contacts_filter_by_first_name(authorized_client):
 async def test_get_contacts_filter_by_email(authorized_client):
     """Test filtering contacts by email."""
     # Create contacts
-    contact1 = contact_data.copy()
-    contact1["email"] = "findme@example.com"
-    contact1["phone"] = "+380501111111"
-
-    await authorized_client.post("/api/contacts", json=contact1)
+    await post_contact(
+        authorized_client, email="findme@example.com", phone="+380501111111"
+    )
 
     # Filter by email
     response = await authorized_client.get("/api/contacts?email=findme@example.com")
@@ -171,7 +249,7 @@ async def test_get_contacts_filter_by_email(authorized_client):
 async def test_get_contact_by_id_success(authorized_client):
     """Test getting a specific contact by ID."""
     # Create contact
-    create_resp = await authorized_client.post("/api/contacts", json=contact_data)
+    create_resp = await post_contact(authorized_client)
     contact_id = create_resp.json()["id"]
 
     # Get contact by ID
@@ -193,7 +271,7 @@ async def test_get_contact_by_id_not_found(authorized_client):
 async def test_update_contact_success(authorized_client):
     """Test updating a contact."""
     # Create contact
-    create_resp = await authorized_client.post("/api/contacts", json=contact_data)
+    create_resp = await post_contact(authorized_client)
     contact_id = create_resp.json()["id"]
 
     # Update contact
@@ -220,7 +298,7 @@ async def test_update_contact_not_found(authorized_client):
 async def test_delete_contact_success(authorized_client):
     """Test deleting a contact."""
     # Create contact
-    create_resp = await authorized_client.post("/api/contacts", json=contact_data)
+    create_resp = await post_contact(authorized_client)
     contact_id = create_resp.json()["id"]
 
     # Delete contact
@@ -240,26 +318,31 @@ async def test_delete_contact_not_found(authorized_client):
 
 
 @pytest.mark.asyncio
-async def test_get_upcoming_birthdays(authorized_client):
+async def test_get_upcoming_birthdays(
+    authorized_client, test_user_in_db, seed_contacts
+):
     """Test getting contacts with upcoming birthdays."""
     today = date.today()
 
     # Create contact with birthday in 3 days
-    upcoming_contact = contact_data.copy()
     upcoming_birthday = today + timedelta(days=3)
-    upcoming_contact["birthday"] = upcoming_birthday.replace(year=1990).isoformat()
-    upcoming_contact["email"] = "upcoming@example.com"
-    upcoming_contact["phone"] = "+380501111111"
+    upcoming_contact = {
+        **contact_data,
+        "birthday": upcoming_birthday.replace(year=1990).isoformat(),
+        "email": "upcoming@example.com",
+        "phone": "+380501111111",
+    }
 
     # Create contact with past birthday
-    past_contact = contact_data.copy()
     past_birthday = today - timedelta(days=30)
-    past_contact["birthday"] = past_birthday.replace(year=1990).isoformat()
-    past_contact["email"] = "past@example.com"
-    past_contact["phone"] = "+380502222222"
+    past_contact = {
+        **contact_data,
+        "birthday": past_birthday.replace(year=1990).isoformat(),
+        "email": "past@example.com",
+        "phone": "+380502222222",
+    }
 
-    await authorized_client.post("/api/contacts", json=upcoming_contact)
-    await authorized_client.post("/api/contacts", json=past_contact)
+    await seed_contacts(test_user_in_db, [upcoming_contact, past_contact])
 
     # Get upcoming birthdays
     response = await authorized_client.get(
@@ -273,8 +356,75 @@ async def test_get_upcoming_birthdays(authorized_client):
     assert "upcoming@example.com" in emails
 
 
+class FrozenDate(date):
+    """date whose today() is fixed to December 28th, just before a year ends."""
+
+    @classmethod
+    def today(cls):
+        return cls(2025, 12, 28)
+
+
 @pytest.mark.asyncio
-async def test_contacts_isolation_between_users(client, create_authenticated_user):
+@pytest.mark.parametrize(
+    "days_ahead, expected_emails",
+    [
+        pytest.param(0, set(), id="zero-days"),
+        pytest.param(-5, set(), id="negative-days"),
+        pytest.param(
+            7, {"dec30@example.com", "jan2@example.com"}, id="wraps-december-31"
+        ),
+        pytest.param(
+            365,
+            {
+                "dec28@example.com",
+                "dec30@example.com",
+                "jan2@example.com",
+                "feb10@example.com",
+            },
+            id="full-year",
+        ),
+    ],
+)
+async def test_get_upcoming_birthdays_period_edges(
+    authorized_client,
+    test_user_in_db,
+    seed_contacts,
+    monkeypatch,
+    days_ahead,
+    expected_emails,
+):
+    """Test upcoming birthdays for empty, year-wrapping and full-year periods."""
+    monkeypatch.setattr("src.services.contacts.date", FrozenDate)
+    birthdays = {
+        "dec28": "1990-12-28",
+        "dec30": "1990-12-30",
+        "jan2": "1991-01-02",
+        "feb10": "1991-02-10",
+    }
+    await seed_contacts(
+        test_user_in_db,
+        [
+            {
+                **contact_data,
+                "birthday": birthday,
+                "email": f"{name}@example.com",
+                "phone": f"+38050125{i:04d}",
+            }
+            for i, (name, birthday) in enumerate(birthdays.items())
+        ],
+    )
+
+    response = await authorized_client.get(
+        f"/api/contacts/birthdays/upcoming?days_ahead={days_ahead}"
+    )
+    assert response.status_code == 200
+    assert {contact["email"] for contact in response.json()} == expected_emails
+
+
+@pytest.mark.asyncio
+async def test_contacts_isolation_between_users(
+    client, create_authenticated_user, seed_contacts
+):
     """Test that users can only access their own contacts."""
     # Create first user
     user1_token, user1 = await create_authenticated_user(
@@ -282,13 +432,7 @@ async def test_contacts_isolation_between_users(client, create_authenticated_use
     )
 
     # Create contact for first user
-    contact1 = contact_data.copy()
-    contact1["email"] = "user1contact@example.com"
-    await client.post(
-        "/api/contacts",
-        json=contact1,
-        headers={"Authorization": f"Bearer {user1_token}"},
-    )
+    await seed_contacts(user1, [{**contact_data, "email": "user1contact@example.com"}])
 
     # Create second user
     user2_token, user2 = await create_authenticated_user(
@@ -305,31 +449,11 @@ async def test_contacts_isolation_between_users(client, create_authenticated_use
     assert len(data) == 0
 
 
-@pytest.mark.asyncio
-async def test_create_contact_missing_required_fields(authorized_client):
-    """Test creating contact with missing required fields."""
-    incomplete_data = {"first_name": "John"}
-
-    response = await authorized_client.post("/api/contacts", json=incomplete_data)
-    assert response.status_code == 422
-
-
-@pytest.mark.asyncio
-async def test_create_contact_invalid_email(authorized_client):
-    """Test creating contact with invalid email format."""
-    invalid_contact = contact_data.copy()
-    invalid_contact["email"] = "not-an-email"
-    invalid_contact["phone"] = "+380509999999"
-
-    response = await authorized_client.post("/api/contacts", json=invalid_contact)
-    assert response.status_code == 422
-
-
 @pytest.mark.asyncio
 async def test_update_contact_partial_update(authorized_client):
     """Test partial update of contact (only some fields)."""
     # Create contact
-    create_resp = await authorized_client.post("/api/contacts", json=contact_data)
+    create_resp = await post_contact(authorized_client)
     contact_id = create_resp.json()["id"]
 
     # Update only additional_info
@@ -2,15 +2,27 @@ import os
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
+from passlib.context import CryptContext
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    async_sessionmaker,
+    AsyncConnection,
+    AsyncEngine,
+)
 from redis.asyncio import Redis
 from typing import AsyncGenerator
+from urllib.parse import urlsplit
 
 from main import app
-from src.database.models import Base, User
+from src.database.models import Base, Contact, User, UserRole
 from src.database.db import get_db
 from src.database.redis import get_redis
-from src.services.auth import create_access_token, Hash
+from src.api.users import limiter
+from src.services.auth import create_access_token, Hash, hasher
+from src.schemas import ContactModel
+from src.services.users import UserService
 
 
 SQLALCHEMY_DATABASE_URL = (
@@ -19,51 +31,147 @@ SQLALCHEMY_DATABASE_URL = (
 )
 REDIS_URL = os.getenv("TEST_REDIS_URL") or "redis://localhost:6380/0"
 
+# Under pytest-xdist every worker gets its own database and Redis DB index.
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+if XDIST_WORKER:
+    _db_url = make_url(SQLALCHEMY_DATABASE_URL)
+    SQLALCHEMY_DATABASE_URL = _db_url.set(
+        database=f"{_db_url.database}_{XDIST_WORKER}"
+    ).render_as_string(hide_password=False)
+    _redis_db = int(XDIST_WORKER.removeprefix("gw"))
+    if _redis_db >= 16:
+        raise RuntimeError(
+            "Redis has 16 databases; run pytest-xdist with at most 16 workers"
+        )
+    REDIS_URL = urlsplit(REDIS_URL)._replace(path=f"/{_redis_db}").geturl()
+
 test_user = {
     "email": "deadpool@example.com",
     "password": "12345678",
 }
+UNUSABLE_PASSWORD = "!"  # Never produced by bcrypt, so no password matches it
 
 
-@pytest_asyncio.fixture(scope="function")
-async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
+@pytest.fixture(scope="session", autouse=True)
+def fast_bcrypt():
+    """
+    Use the minimum bcrypt cost in tests only; production keeps the default.
+    """
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Hash, "pwd_context", context)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoized_password_hash():
+    """
+    Hash each distinct password with bcrypt only once per test session.
+    The cached hashes are still real bcrypt hashes, so verification is unchanged.
+    """
+    hashes: dict[str, str] = {}
+    original = Hash.get_password_hash
+
+    def get_password_hash(self: Hash, password: str) -> str:
+        if password not in hashes:
+            hashes[password] = original(self, password)
+        return hashes[password]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Hash, "get_password_hash", get_password_hash)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def worker_database() -> None:
+    """
+    Create the per-worker test database when running under pytest-xdist.
+    """
+    if not XDIST_WORKER:
+        return
+    db_url = make_url(SQLALCHEMY_DATABASE_URL)
+    engine = create_async_engine(
+        db_url.set(database="postgres"), isolation_level="AUTOCOMMIT"
+    )
+    try:
+        async with engine.connect() as conn:
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": db_url.database},
+            )
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{db_url.database}"'))
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_engine(worker_database) -> AsyncGenerator[AsyncEngine, None]:
     """
     Session-scoped async engine, created once per test session.
-    Bound to pytest-asyncio's event loop.
+    Bound to pytest-asyncio's session event loop. The local test database
+    does not drop idle connections, so checkouts skip the pre-ping, and JIT
+    is off since test queries are too small to benefit from compilation.
     """
-    engine = create_async_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+    engine = create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=5,
+        max_overflow=0,
+        pool_pre_ping=False,
+        connect_args={"server_settings": {"jit": "off"}},
+    )
     try:
         yield engine
     finally:
         await engine.dispose()
 
 
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def init_db(async_engine: AsyncEngine):
+    """
+    Rebuild all tables once per test session in a single transaction.
+    Tables are left in place afterwards and dropped by the next session.
+    """
+
+    def rebuild_schema(sync_conn) -> None:
+        Base.metadata.drop_all(sync_conn)
+        Base.metadata.create_all(sync_conn, checkfirst=False)
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(rebuild_schema)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_connection(
+    async_engine: AsyncEngine,
+) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Connection wrapped in an outer transaction that is rolled back after
+    each test, so no data leaks between tests.
+    """
+    async with async_engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
 @pytest.fixture(scope="function")
-def testing_session_local(async_engine: AsyncEngine):
+def testing_session_local(db_connection: AsyncConnection):
     """
-    Session factory bound to the session-scoped engine.
+    Session factory bound to the test's connection.
+    Session commits only release a savepoint inside the outer transaction.
     """
     return async_sessionmaker(
-        bind=async_engine,
+        bind=db_connection,
         autocommit=False,
         autoflush=False,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def init_db(async_engine: AsyncEngine):
-    """
-    Drop and recreate all tables before each test.
-    """
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-
 @pytest_asyncio.fixture(scope="function")
 async def db_session(testing_session_local):
     """
@@ -73,23 +181,60 @@ async def db_session(testing_session_local):
         yield session
 
 
-@pytest_asyncio.fixture(scope="function")
-async def redis_session():
+@pytest_asyncio.fixture(scope="session")
+async def redis_client() -> AsyncGenerator[Redis, None]:
     """
-    Real Redis client for tests on localhost:6380.
-    Flush DB before and after each test.
+    Real Redis client for tests on localhost:6380, shared by the session.
+    The DB is flushed once on start to drop leftovers from earlier runs.
     """
-    client = Redis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
-    await client.flushdb()
-    yield client
+    client = Redis.from_url(
+        REDIS_URL, encoding="utf-8", decode_responses=True, max_connections=8
+    )
     await client.flushdb()
-    await client.aclose()
+    try:
+        yield client
+    finally:
+        await client.aclose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(testing_session_local, redis_session):
+async def redis_session(redis_client: Redis):
+    """
+    Shared Redis client for a single test.
+    Flush DB and the local user cache after each test.
+    """
+    UserService.clear_local_cache()
+    yield redis_client
+    await redis_client.flushdb(asynchronous=True)
+    UserService.clear_local_cache()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_rate_limits():
     """
-    Async HTTP client with overridden DB and Redis dependencies.
+    Clear rate limiter counters so limits never carry over between tests.
+    """
+    limiter.reset()
+    yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Async HTTP client shared by the whole test session.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(http_client: AsyncClient, testing_session_local, redis_session):
+    """
+    Shared async HTTP client with overridden DB and Redis dependencies.
+    Overrides, headers and cookies are reset after each test.
     """
 
     async def override_get_db():
@@ -105,68 +250,112 @@ async def client(testing_session_local, redis_session):
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_redis] = override_get_redis
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as test_client:
-        yield test_client
+    try:
+        yield http_client
+    finally:
+        app.dependency_overrides.clear()
+        http_client.headers.pop("Authorization", None)
+        http_client.cookies.clear()
 
-    app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture(scope="session")
+async def seeded_user_id(async_engine: AsyncEngine, init_db) -> int:
+    """
+    Commit the verified test user once per test session and return its id.
+    """
+    session_maker = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    async with session_maker() as session:
+        current_user = User(
+            email=test_user["email"],
+            password_hash=hasher.get_password_hash(test_user["password"]),
+            email_verified=True,
+            avatar_url="https://www.gravatar.com/avatar/test",
+        )
+        session.add(current_user)
+        await session.commit()
+        return current_user.id
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_user_in_db(db_session):
+async def test_user_in_db(db_session, seeded_user_id: int):
     """
-    Create a verified test user in DB.
+    Load the seeded verified test user into the test's DB session.
+    Changes made by a test are rolled back with its transaction.
     """
-    hash_password = Hash().get_password_hash(test_user["password"])
-    current_user = User(
-        email=test_user["email"],
-        password_hash=hash_password,
-        email_verified=True,
-        avatar_url="https://www.gravatar.com/avatar/test",
-    )
-    db_session.add(current_user)
-    await db_session.commit()
-    await db_session.refresh(current_user)
-    return current_user
+    return await db_session.get(User, seeded_user_id)
+
+
+@pytest.fixture(scope="session")
+def access_tokens() -> dict[str, str]:
+    """
+    Access tokens signed once per email for the whole test session.
+    """
+    return {}
 
 
 @pytest_asyncio.fixture(scope="function")
-async def get_token(test_user_in_db):
+async def get_token(test_user_in_db, access_tokens):
     """
     Generate an access token for the test user.
     """
-    token = await create_access_token(data={"sub": test_user_in_db.email})
-    return token
+    email = test_user_in_db.email
+    if email not in access_tokens:
+        access_tokens[email] = create_access_token(data={"sub": email})
+    return access_tokens[email]
 
 
 @pytest_asyncio.fixture
 async def authorized_client(client: AsyncClient, get_token: str) -> AsyncClient:
     """Client with authorization header."""
-    client.headers.update({"Authorization": f"Bearer {get_token}"})
+    client.headers["Authorization"] = f"Bearer {get_token}"
     return client
 
 
 @pytest_asyncio.fixture
-async def create_authenticated_user(client: AsyncClient, db_session):
+async def create_authenticated_user(client: AsyncClient, db_session, access_tokens):
     """Factory fixture to create and authenticate users."""
 
-    async def _create_user(email: str, password: str):
-        """Create a new user and return their token."""
+    async def _create_user(
+        email: str, password: str | None = None, role: UserRole = UserRole.USER
+    ):
+        """
+        Create a new user and return their token.
+        Without a password the user gets an unusable hash and skips bcrypt.
+        """
         # Create user directly in database
-        password_hash = Hash().get_password_hash(password)
+        password_hash = (
+            hasher.get_password_hash(password) if password else UNUSABLE_PASSWORD
+        )
         user = User(
             email=email,
             password_hash=password_hash,
             email_verified=True,
+            role=role,
         )
         db_session.add(user)
         await db_session.commit()
         await db_session.refresh(user)
 
         # Create access token
-        token = await create_access_token(data={"sub": user.email})
-        return token, user
+        if user.email not in access_tokens:
+            access_tokens[user.email] = create_access_token(data={"sub": user.email})
+        return access_tokens[user.email], user
 
     return _create_user
+
+
+@pytest_asyncio.fixture
+async def seed_contacts(db_session):
+    """Factory fixture to insert contacts directly with a single commit."""
+
+    async def _seed_contacts(user: User, contacts: list[dict]) -> list[Contact]:
+        """Validate contact data and bulk insert it for the given user."""
+        rows = [
+            Contact(**ContactModel(**data).model_dump(), user_id=user.id)
+            for data in contacts
+        ]
+        db_session.add_all(rows)
+        await db_session.commit()
+        return rows
+
+    return _seed_contacts
@@ -0,0 +1,26 @@
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def scalar_result():
+    """Factory for a mock result whose scalar_one_or_none returns a value"""
+
+    def _scalar_result(value):
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = value
+        return result
+
+    return _scalar_result
+
+
+@pytest.fixture
+def scalars_result():
+    """Factory for a mock result whose scalars().all() returns values"""
+
+    def _scalars_result(values):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(values)
+        return result
+
+    return _scalars_result
@@ -1,11 +1,23 @@
 import pytest
 from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.contacts import ContactRepository
 from src.database.models import Contact, User
-from src.schemas import ContactModel, ContactUpdate
+from src.schemas import ContactFilter, ContactModel, ContactUpdate
+
+# Fixed reference date so the birthday tests do not depend on the run date
+TODAY = date(2024, 6, 10)
+
+
+def compile_where(stmt) -> str:
+    """Render a statement's WHERE clause with literal values for PostgreSQL"""
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    return str(sql).split("WHERE", 1)[1]
 
 
 @pytest.fixture
@@ -48,9 +60,9 @@ def mock_contact():
     return contact
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def contact_data():
-    """Sample contact data for creation"""
+    """Sample contact data for creation (frozen, so shared by the module)"""
     return ContactModel(
         first_name="Jane",
         last_name="Smith",
@@ -65,86 +77,70 @@ class TestGetContacts:
     """Tests for get_contacts method"""
 
     @pytest.mark.asyncio
-    async def test_get_contacts_no_filter(
-        self, contact_repository, mock_session, mock_user, mock_contact
+    @pytest.mark.parametrize(
+        "contact_filter",
+        [
+            pytest.param(None, id="no-filter"),
+            pytest.param(ContactFilter(first_name="John"), id="first-name"),
+            pytest.param(ContactFilter(email="john.doe@example.com"), id="email"),
+        ],
+    )
+    async def test_get_contacts_with_filter(
+        self,
+        contact_repository,
+        mock_session,
+        mock_user,
+        mock_contact,
+        contact_filter,
+        scalars_result,
     ):
-        """Test getting contacts without filters"""
+        """Test getting contacts with and without filters"""
         # Arrange
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_contact]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalars_result([mock_contact])
 
         # Act
         contacts = await contact_repository.get_contacts(
-            user=mock_user, skip=0, limit=10, filter=None
+            user=mock_user, skip=0, limit=10, filter=contact_filter
         )
 
         # Assert
         assert len(contacts) == 1
         assert contacts[0].id == 1
         assert contacts[0].first_name == "John"
+        assert contacts[0].email == "john.doe@example.com"
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_contacts_with_first_name_filter(
-        self, contact_repository, mock_session, mock_user, mock_contact
+    async def test_get_contacts_loads_list_columns_only(
+        self, contact_repository, mock_session, mock_user, scalars_result
     ):
-        """Test getting contacts filtered by first name"""
+        """Test that the list query selects only the short response columns"""
         # Arrange
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_contact]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalars_result([])
 
         # Act
-        contacts = await contact_repository.get_contacts(
-            user=mock_user, skip=0, limit=10, filter={"first_name": "John"}
-        )
+        await contact_repository.get_contacts(user=mock_user, skip=0, limit=10)
 
         # Assert
-        assert len(contacts) == 1
-        assert contacts[0].first_name == "John"
-        mock_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_contacts_with_email_filter(
-        self, contact_repository, mock_session, mock_user, mock_contact
-    ):
-        """Test getting contacts filtered by email"""
-        # Arrange
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_contact]
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        # Act
-        contacts = await contact_repository.get_contacts(
-            user=mock_user, skip=0, limit=10, filter={"email": "john.doe@example.com"}
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.split("FROM", 1)[0].strip() == (
+            "SELECT contacts.id, contacts.first_name, contacts.last_name, "
+            "contacts.email, contacts.phone"
         )
 
-        # Assert
-        assert len(contacts) == 1
-        assert contacts[0].email == "john.doe@example.com"
-        mock_session.execute.assert_called_once()
-
     @pytest.mark.asyncio
     async def test_get_contacts_with_pagination(
-        self, contact_repository, mock_session, mock_user
+        self, contact_repository, mock_session, mock_user, scalars_result
     ):
         """Test getting contacts with pagination"""
         # Arrange
         contacts = [
             Contact(id=i, first_name=f"User{i}", user_id=1) for i in range(1, 6)
         ]
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = contacts[2:4]  # Skip 2, limit 2
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalars_result(
+            contacts[2:4]
+        )  # Skip 2, limit 2
 
         # Act
         result = await contact_repository.get_contacts(
@@ -155,6 +151,25 @@ class TestGetContacts:
         assert len(result) == 2
         assert result[0].id == 3
         assert result[1].id == 4
+
+    @pytest.mark.asyncio
+    async def test_get_contacts_after_cursor(
+        self, contact_repository, mock_session, mock_user, scalars_result
+    ):
+        """Test getting contacts after a sort key"""
+        # Arrange
+        contacts = [Contact(id=i, last_name="Doe", user_id=1) for i in range(4, 6)]
+        mock_session.execute.return_value = scalars_result(contacts)
+
+        # Act
+        result = await contact_repository.get_contacts(
+            user=mock_user, skip=0, limit=2, after=("Doe", "John", 3)
+        )
+
+        # Assert
+        assert [contact.id for contact in result] == [4, 5]
+        stmt = mock_session.execute.call_args[0][0]
+        assert "(contacts.last_name, contacts.first_name, contacts.id) >" in str(stmt)
         mock_session.execute.assert_called_once()
 
 
@@ -163,13 +178,11 @@ class TestGetContact:
 
     @pytest.mark.asyncio
     async def test_get_contact_found(
-        self, contact_repository, mock_session, mock_user, mock_contact
+        self, contact_repository, mock_session, mock_user, mock_contact, scalar_result
     ):
         """Test getting an existing contact"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_contact
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(mock_contact)
 
         # Act
         contact = await contact_repository.get_contact(mock_user, contact_id=1)
@@ -182,13 +195,11 @@ class TestGetContact:
 
     @pytest.mark.asyncio
     async def test_get_contact_not_found(
-        self, contact_repository, mock_session, mock_user
+        self, contact_repository, mock_session, mock_user, scalar_result
     ):
         """Test getting a non-existing contact"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(None)
 
         # Act
         contact = await contact_repository.get_contact(mock_user, contact_id=999)
@@ -206,9 +217,6 @@ class TestCreateContact:
         self, contact_repository, mock_session, mock_user, contact_data
     ):
         """Test creating a new contact"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         contact = await contact_repository.create_contact(mock_user, contact_data)
@@ -228,15 +236,11 @@ class TestUpdateContact:
 
     @pytest.mark.asyncio
     async def test_update_contact_success(
-        self, contact_repository, mock_session, mock_user, mock_contact
+        self, contact_repository, mock_session, mock_user, mock_contact, scalar_result
     ):
         """Test updating an existing contact"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_contact
-        mock_session.execute.return_value = mock_result
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
+        mock_session.execute.return_value = scalar_result(mock_contact)
 
         update_data = ContactUpdate(first_name="Johnny", phone="+380509999999")  # type: ignore
 
@@ -255,13 +259,11 @@ class TestUpdateContact:
 
     @pytest.mark.asyncio
     async def test_update_contact_not_found(
-        self, contact_repository, mock_session, mock_user
+        self, contact_repository, mock_session, mock_user, scalar_result
     ):
         """Test updating a non-existing contact"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(None)
 
         update_data = ContactUpdate(first_name="Johnny")  # type: ignore
 
@@ -281,15 +283,11 @@ class TestDeleteContact:
 
     @pytest.mark.asyncio
     async def test_delete_contact_success(
-        self, contact_repository, mock_session, mock_user, mock_contact
+        self, contact_repository, mock_session, mock_user, mock_contact, scalar_result
     ):
         """Test deleting an existing contact"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_contact
-        mock_session.execute.return_value = mock_result
-        mock_session.delete = AsyncMock()
-        mock_session.commit = AsyncMock()
+        mock_session.execute.return_value = scalar_result(mock_contact)
 
         # Act
         deleted_contact = await contact_repository.delete_contact(
@@ -304,13 +302,11 @@ class TestDeleteContact:
 
     @pytest.mark.asyncio
     async def test_delete_contact_not_found(
-        self, contact_repository, mock_session, mock_user
+        self, contact_repository, mock_session, mock_user, scalar_result
     ):
         """Test deleting a non-existing contact"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(None)
 
         # Act
         deleted_contact = await contact_repository.delete_contact(
@@ -328,11 +324,11 @@ class TestGetContactsWithBirthdayInPeriod:
 
     @pytest.mark.asyncio
     async def test_get_contacts_with_upcoming_birthdays(
-        self, contact_repository, mock_session, mock_user
+        self, contact_repository, mock_session, mock_user, scalars_result
     ):
         """Test getting contacts with birthdays in a date range"""
         # Arrange
-        today = date.today()
+        today = TODAY
         next_week = today + timedelta(days=7)
 
         contacts_with_birthdays = [
@@ -344,11 +340,7 @@ class TestGetContactsWithBirthdayInPeriod:
             ),
         ]
 
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = contacts_with_birthdays
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalars_result(contacts_with_birthdays)
 
         # Act
         contacts = await contact_repository.get_contacts_with_birthday_in_period(
@@ -363,18 +355,14 @@ class TestGetContactsWithBirthdayInPeriod:
 
     @pytest.mark.asyncio
     async def test_get_contacts_no_birthdays_in_period(
-        self, contact_repository, mock_session, mock_user
+        self, contact_repository, mock_session, mock_user, scalars_result
     ):
         """Test when no contacts have birthdays in the period"""
         # Arrange
-        today = date.today()
+        today = TODAY
         next_week = today + timedelta(days=7)
 
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalars_result([])
 
         # Act
         contacts = await contact_repository.get_contacts_with_birthday_in_period(
@@ -384,3 +372,90 @@ class TestGetContactsWithBirthdayInPeriod:
         # Assert
         assert len(contacts) == 0
         mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "start_date, end_date, expected_where",
+        [
+            pytest.param(
+                date(2024, 6, 10),
+                date(2024, 6, 17),
+                "contacts.birthday_mmdd > 610 AND contacts.birthday_mmdd <= 617",
+                id="within-year",
+            ),
+            pytest.param(
+                date(2024, 12, 28),
+                date(2025, 1, 4),
+                "(contacts.birthday_mmdd > 1228 OR contacts.birthday_mmdd <= 104)",
+                id="wraps-december-31",
+            ),
+            pytest.param(
+                date(2028, 1, 1),
+                date(2028, 12, 31),
+                "contacts.birthday_mmdd > 101 AND contacts.birthday_mmdd <= 1231",
+                id="365-days-in-leap-year",
+            ),
+            pytest.param(
+                date(2028, 2, 29),
+                date(2029, 2, 28),
+                "(contacts.birthday_mmdd > 229 OR contacts.birthday_mmdd <= 228)",
+                id="from-february-29",
+            ),
+        ],
+    )
+    async def test_get_contacts_birthday_period_filter(
+        self,
+        contact_repository,
+        mock_session,
+        mock_user,
+        scalars_result,
+        start_date,
+        end_date,
+        expected_where,
+    ):
+        """Test the month-day range built for a birthday period"""
+        # Arrange
+        mock_session.execute.return_value = scalars_result([])
+
+        # Act
+        await contact_repository.get_contacts_with_birthday_in_period(
+            mock_user, start_date=start_date, end_date=end_date
+        )
+
+        # Assert
+        where = compile_where(mock_session.execute.call_args[0][0])
+        assert expected_where in where
+
+    @pytest.mark.asyncio
+    async def test_get_contacts_birthday_period_full_year(
+        self, contact_repository, mock_session, mock_user, scalars_result
+    ):
+        """Test that a period of a year or more does not filter by month-day"""
+        # Arrange
+        mock_session.execute.return_value = scalars_result([])
+
+        # Act
+        await contact_repository.get_contacts_with_birthday_in_period(
+            mock_user, start_date=TODAY, end_date=TODAY + timedelta(days=365)
+        )
+
+        # Assert
+        where = compile_where(mock_session.execute.call_args[0][0])
+        assert "contacts.birthday_mmdd IS NOT NULL" in where
+        assert "contacts.birthday_mmdd >" not in where
+        assert "contacts.birthday_mmdd <=" not in where
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("days", [0, -1, -30], ids=["zero", "minus-1", "minus-30"])
+    async def test_get_contacts_birthday_period_empty(
+        self, contact_repository, mock_session, mock_user, days
+    ):
+        """Test that an empty or negative period returns no contacts"""
+        # Act
+        contacts = await contact_repository.get_contacts_with_birthday_in_period(
+            mock_user, start_date=TODAY, end_date=TODAY + timedelta(days=days)
+        )
+
+        # Assert
+        assert contacts == []
+        mock_session.execute.assert_not_called()
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.users import UserRepository
@@ -7,6 +8,17 @@ from src.database.models import User, UserRole
 from src.schemas import UserCreate
 
 
+def compile_update(stmt) -> tuple[str, str]:
+    """Render an UPDATE for PostgreSQL and return its SET and WHERE clauses"""
+    sql = str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    set_clause, rest = sql.split(" SET ", 1)[1].split(" WHERE ", 1)
+    return set_clause, rest.split(" RETURNING ", 1)[0]
+
+
 @pytest.fixture
 def mock_session():
     """Create a mock AsyncSession"""
@@ -34,9 +46,9 @@ def mock_user():
     return user
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_create_data():
-    """Sample user creation data"""
+    """Sample user creation data (frozen, so shared by the module)"""
     return UserCreate(
         email="newuser@example.com",
         password="SecurePassword123!",
@@ -48,12 +60,12 @@ class TestGetUserById:
     """Tests for get_user_by_id method"""
 
     @pytest.mark.asyncio
-    async def test_get_user_by_id_found(self, user_repository, mock_session, mock_user):
+    async def test_get_user_by_id_found(
+        self, user_repository, mock_session, mock_user, scalar_result
+    ):
         """Test getting an existing user by ID"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(mock_user)
 
         # Act
         user = await user_repository.get_user_by_id(user_id=1)
@@ -65,12 +77,12 @@ class TestGetUserById:
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_user_by_id_not_found(self, user_repository, mock_session):
+    async def test_get_user_by_id_not_found(
+        self, user_repository, mock_session, scalar_result
+    ):
         """Test getting a non-existing user by ID"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(None)
 
         # Act
         user = await user_repository.get_user_by_id(user_id=999)
@@ -85,13 +97,11 @@ class TestGetUserByEmail:
 
     @pytest.mark.asyncio
     async def test_get_user_by_email_found(
-        self, user_repository, mock_session, mock_user
+        self, user_repository, mock_session, mock_user, scalar_result
     ):
         """Test getting an existing user by email"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(mock_user)
 
         # Act
         user = await user_repository.get_user_by_email(email="test@example.com")
@@ -102,12 +112,12 @@ class TestGetUserByEmail:
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_user_by_email_not_found(self, user_repository, mock_session):
+    async def test_get_user_by_email_not_found(
+        self, user_repository, mock_session, scalar_result
+    ):
         """Test getting a non-existing user by email"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(None)
 
         # Act
         user = await user_repository.get_user_by_email(email="nonexistent@example.com")
@@ -118,13 +128,11 @@ class TestGetUserByEmail:
 
     @pytest.mark.asyncio
     async def test_get_user_by_email_case_sensitive(
-        self, user_repository, mock_session
+        self, user_repository, mock_session, scalar_result
     ):
         """Test that email lookup is case-sensitive"""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = scalar_result(None)
 
         # Act
         user = await user_repository.get_user_by_email(email="TEST@EXAMPLE.COM")
@@ -134,6 +142,41 @@ class TestGetUserByEmail:
         mock_session.execute.assert_called_once()
 
 
+class TestGetAuthUserByEmail:
+    """Tests for get_auth_user_by_email method"""
+
+    @pytest.mark.asyncio
+    async def test_get_auth_user_by_email_found(
+        self, user_repository, mock_session, mock_user, scalar_result
+    ):
+        """Test getting an existing user for authentication"""
+        # Arrange
+        mock_session.execute.return_value = scalar_result(mock_user)
+
+        # Act
+        user = await user_repository.get_auth_user_by_email(email="test@example.com")
+
+        # Assert
+        assert user is not None
+        assert user.email == "test@example.com"
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_auth_user_by_email_not_found(
+        self, user_repository, mock_session, scalar_result
+    ):
+        """Test getting a non-existent user for authentication"""
+        # Arrange
+        mock_session.execute.return_value = scalar_result(None)
+
+        # Act
+        user = await user_repository.get_auth_user_by_email(email="missing@example.com")
+
+        # Assert
+        assert user is None
+        mock_session.execute.assert_called_once()
+
+
 class TestCreateUser:
     """Tests for create_user method"""
 
@@ -142,9 +185,6 @@ class TestCreateUser:
         self, user_repository, mock_session, user_create_data
     ):
         """Test creating a user without avatar"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         user = await user_repository.create_user(user_create_data)
@@ -155,7 +195,7 @@ class TestCreateUser:
         assert user.avatar_url is None
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_user_with_avatar(
@@ -163,8 +203,6 @@ class TestCreateUser:
     ):
         """Test creating a user with avatar URL"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         avatar_url = "https://example.com/avatar.jpg"
 
         # Act
@@ -178,7 +216,7 @@ class TestCreateUser:
         assert user.avatar_url == avatar_url
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        mock_session.refresh.assert_not_called()
 
 
 class TestSetEmailVerified:
@@ -188,8 +226,6 @@ class TestSetEmailVerified:
     async def test_set_email_verified(self, user_repository, mock_session, mock_user):
         """Test marking user email as verified"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         assert mock_user.email_verified is False
 
         # Act
@@ -198,7 +234,7 @@ class TestSetEmailVerified:
         # Assert
         assert updated_user.email_verified is True
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
 
 class TestUpdateUserAvatar:
@@ -208,8 +244,6 @@ class TestUpdateUserAvatar:
     async def test_update_user_avatar(self, user_repository, mock_session, mock_user):
         """Test updating user avatar URL"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         new_avatar_url = "https://example.com/new-avatar.jpg"
         assert mock_user.avatar_url is None
 
@@ -221,7 +255,7 @@ class TestUpdateUserAvatar:
         # Assert
         assert updated_user.avatar_url == new_avatar_url
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_user_avatar_replace_existing(
@@ -229,8 +263,6 @@ class TestUpdateUserAvatar:
     ):
         """Test replacing existing avatar URL"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         mock_user.avatar_url = "https://example.com/old-avatar.jpg"
         new_avatar_url = "https://example.com/new-avatar.jpg"
 
@@ -242,7 +274,7 @@ class TestUpdateUserAvatar:
         # Assert
         assert updated_user.avatar_url == new_avatar_url
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
 
 class TestUpdateUserPassword:
@@ -252,8 +284,6 @@ class TestUpdateUserPassword:
     async def test_update_user_password(self, user_repository, mock_session, mock_user):
         """Test updating user password"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         old_hash = mock_user.password_hash
         new_hash = "new_hashed_password_123"
 
@@ -264,7 +294,7 @@ class TestUpdateUserPassword:
         assert updated_user.password_hash == new_hash
         assert updated_user.password_hash != old_hash
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
 
 class TestUpdateResetPasswordToken:
@@ -276,8 +306,6 @@ class TestUpdateResetPasswordToken:
     ):
         """Test setting reset password token"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         token = "reset_token_123abc"
         assert mock_user.reset_password_token is None
 
@@ -289,7 +317,7 @@ class TestUpdateResetPasswordToken:
         # Assert
         assert updated_user.reset_password_token == token
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_clear_reset_password_token(
@@ -297,8 +325,6 @@ class TestUpdateResetPasswordToken:
     ):
         """Test clearing reset password token"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         mock_user.reset_password_token = "existing_token"
 
         # Act
@@ -309,7 +335,99 @@ class TestUpdateResetPasswordToken:
         # Assert
         assert updated_user.reset_password_token is None
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
+
+
+class TestSetResetPasswordTokenIfAbsent:
+    """Tests for set_reset_password_token_if_absent method"""
+
+    @pytest.mark.asyncio
+    async def test_set_token_when_absent(
+        self, user_repository, mock_session, mock_user, scalar_result
+    ):
+        """Test storing a token only for a user without one"""
+        # Arrange
+        mock_session.execute.return_value = scalar_result(mock_user)
+
+        # Act
+        user = await user_repository.set_reset_password_token_if_absent(
+            "test@example.com", "reset_token_123abc"
+        )
+
+        # Assert
+        assert user is mock_user
+        mock_session.execute.assert_called_once()
+        set_clause, where = compile_update(mock_session.execute.call_args[0][0])
+        assert set_clause == "reset_password_token='reset_token_123abc'"
+        assert where == (
+            "users.email = 'test@example.com' "
+            "AND users.reset_password_token IS NULL"
+        )
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_token_already_present(
+        self, user_repository, mock_session, scalar_result
+    ):
+        """Test that nothing is returned when no user without a token matches"""
+        # Arrange
+        mock_session.execute.return_value = scalar_result(None)
+
+        # Act
+        user = await user_repository.set_reset_password_token_if_absent(
+            "test@example.com", "reset_token_123abc"
+        )
+
+        # Assert
+        assert user is None
+        mock_session.execute.assert_called_once()
+
+
+class TestResetPassword:
+    """Tests for reset_password method"""
+
+    @pytest.mark.asyncio
+    async def test_reset_password_matching_token(
+        self, user_repository, mock_session, mock_user, scalar_result
+    ):
+        """Test resetting the password only when the stored token matches"""
+        # Arrange
+        mock_session.execute.return_value = scalar_result(mock_user)
+
+        # Act
+        user = await user_repository.reset_password(
+            "test@example.com", "reset_token_123abc", "new_hashed_password"
+        )
+
+        # Assert
+        assert user is mock_user
+        mock_session.execute.assert_called_once()
+        set_clause, where = compile_update(mock_session.execute.call_args[0][0])
+        assert set_clause == (
+            "password_hash='new_hashed_password', reset_password_token=NULL"
+        )
+        assert where == (
+            "users.email = 'test@example.com' "
+            "AND users.reset_password_token = 'reset_token_123abc'"
+        )
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reset_password_wrong_token(
+        self, user_repository, mock_session, scalar_result
+    ):
+        """Test that a mismatched token updates nothing"""
+        # Arrange
+        mock_session.execute.return_value = scalar_result(None)
+
+        # Act
+        user = await user_repository.reset_password(
+            "test@example.com", "wrong_token", "new_hashed_password"
+        )
+
+        # Assert
+        assert user is None
+        mock_session.execute.assert_called_once()
 
 
 class TestUpdateMultipleFields:
@@ -320,9 +438,6 @@ class TestUpdateMultipleFields:
         self, user_repository, mock_session, mock_user
     ):
         """Test updating a single allowed field"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         updated_user = await user_repository.update_multiple_fields(
@@ -332,16 +447,13 @@ class TestUpdateMultipleFields:
         # Assert
         assert updated_user.avatar_url == "https://example.com/avatar.jpg"
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_multiple_allowed_fields(
         self, user_repository, mock_session, mock_user
     ):
         """Test updating multiple allowed fields atomically"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         updated_user = await user_repository.update_multiple_fields(
@@ -356,16 +468,13 @@ class TestUpdateMultipleFields:
         assert updated_user.email_verified is True
         assert updated_user.reset_password_token == "token123"
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_protected_field_raises_error(
         self, user_repository, mock_session, mock_user
     ):
         """Test that updating protected fields raises ValueError"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act & Assert
         with pytest.raises(ValueError, match="Cannot update protected fields: email"):
@@ -381,9 +490,6 @@ class TestUpdateMultipleFields:
         self, user_repository, mock_session, mock_user
     ):
         """Test that updating non-existent fields raises ValueError"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act & Assert
         with pytest.raises(ValueError, match="Fields do not exist in User model"):
@@ -399,9 +505,6 @@ class TestUpdateMultipleFields:
         self, user_repository, mock_session, mock_user
     ):
         """Test that mixing allowed and protected fields raises error"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act & Assert
         with pytest.raises(ValueError, match="Cannot update protected fields: id"):
@@ -419,9 +522,6 @@ class TestUpdateMultipleFields:
         self, user_repository, mock_session, mock_user
     ):
         """Test updating all allowed fields at once"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Act
         updated_user = await user_repository.update_multiple_fields(
@@ -438,15 +538,11 @@ class TestUpdateMultipleFields:
         assert updated_user.email_verified is True
         assert updated_user.reset_password_token == "token123"
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_no_fields(self, user_repository, mock_session, mock_user):
         """Test calling update with no fields - should not commit"""
-        # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
-        mock_session.add = AsyncMock()
 
         # Act
         updated_user = await user_repository.update_multiple_fields(mock_user)
@@ -463,8 +559,6 @@ class TestUpdateMultipleFields:
     ):
         """Test updating fields with None values (clearing fields)"""
         # Arrange
-        mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
         mock_user.avatar_url = "https://example.com/old.jpg"
         mock_user.reset_password_token = "old_token"
 
@@ -477,4 +571,4 @@ class TestUpdateMultipleFields:
         assert updated_user.avatar_url is None
         assert updated_user.reset_password_token is None
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(mock_user)
+        mock_session.refresh.assert_not_called()